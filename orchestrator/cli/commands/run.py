@@ -147,14 +147,12 @@ def parse_context(args: Namespace, workflow_context: Dict[str, Any] | None = Non
         if not context_file.exists():
             raise FileNotFoundError(f"Context file not found: {context_file}")
 
-        with open(context_file, 'r') as f:
-            file_context = json.load(f)
-            if not isinstance(file_context, dict):
-                raise ValueError(f"Context file must contain a JSON object, got {type(file_context).__name__}")
-
-            # Convert all values to strings
-            for key, value in file_context.items():
-                context[str(key)] = str(value)
+        file_context = json.loads(context_file.read_bytes())
+        if not isinstance(file_context, dict):
+            raise ValueError(f"Context file must contain a JSON object, got {type(file_context).__name__}")
+
+        # Convert all values to strings
+        context.update((str(key), str(value)) for key, value in file_context.items())
 
     return context
 
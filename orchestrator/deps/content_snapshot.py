@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import PurePosixPath
 from pathlib import Path
@@ -13,6 +14,9 @@ from typing import Literal
 MAX_INJECTION_BYTES = 262144
 TRUNCATION_SUMMARY_RESERVE_BYTES = 512
 MAX_INSTRUCTION_BYTES = 261630
+# Below this many files a thread pool costs more than the overlapped reads save.
+_PARALLEL_READ_MIN_FILES = 4
+_MAX_READ_WORKERS = 8
 
 DependencyRole = Literal["required", "optional"]
 TruncationStatus = Literal["complete", "truncated", "omitted"]
@@ -38,6 +42,39 @@ def _immutable_utf8_bytes(value: bytes) -> bytes:
     return immutable
 
 
+def read_normalized_utf8(path: Path) -> bytes:
+    """Read ``path`` as strict UTF-8 with universal-newline normalization.
+
+    Byte-for-byte equivalent to ``path.read_text(encoding="utf-8").encode("utf-8")``
+    without the text-mode decode/re-encode round trip. CR and LF never occur
+    inside multi-byte UTF-8 sequences, so newlines can be rewritten on bytes.
+    """
+    raw = path.read_bytes()
+    raw.decode("utf-8")
+    if b"\r" in raw:
+        raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return raw
+
+
+def _read_normalized_or_error(path: Path) -> bytes | Exception:
+    try:
+        return read_normalized_utf8(path)
+    except Exception as exc:
+        return exc
+
+
+def read_normalized_utf8_many(paths: Sequence[Path]) -> list[bytes | Exception]:
+    """Apply ``read_normalized_utf8`` to each path, overlapping reads for larger batches.
+
+    Results are in input order; a failed read yields its exception instead of
+    raising, so callers can report failures in authored order.
+    """
+    if len(paths) < _PARALLEL_READ_MIN_FILES:
+        return [_read_normalized_or_error(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(paths))) as pool:
+        return list(pool.map(_read_normalized_or_error, paths))
+
+
 def _strict_utf8_prefix(value: bytes, maximum_bytes: int) -> bytes:
     prefix = value[: max(0, maximum_bytes)]
     while prefix:
@@ -297,29 +334,32 @@ def snapshot_content_dependencies(
                 row,
             )
 
-    payloads: list[DependencyContent] = []
-    seen: set[str] = set()
+    first_rows: dict[str, AuthoredDependencyRow] = {}
     for row in rows:
         target = row.canonical_target
-        if target is None or target in seen:
-            continue
-        seen.add(target)
-        try:
-            # Text mode deliberately preserves the established YAML behavior:
-            # strict UTF-8 plus universal-newline normalization.
-            normalized = (root / target).read_text(encoding="utf-8").encode("utf-8")
-        except UnicodeDecodeError as exc:
+        if target is not None and target not in first_rows:
+            first_rows[target] = row
+
+    # Preserves the established YAML behavior: strict UTF-8 plus
+    # universal-newline normalization.
+    results = read_normalized_utf8_many([root / target for target in first_rows])
+
+    payloads: list[DependencyContent] = []
+    for (target, row), normalized in zip(first_rows.items(), results):
+        if isinstance(normalized, UnicodeDecodeError):
             raise ContentDependencySnapshotError(
                 "invalid_utf8_dependency",
                 "decode",
                 row,
-            ) from exc
-        except OSError as exc:
+            ) from normalized
+        if isinstance(normalized, OSError):
             raise ContentDependencySnapshotError(
                 "unreadable_dependency",
                 "read",
                 row,
-            ) from exc
+            ) from normalized
+        if isinstance(normalized, Exception):
+            raise normalized
         payloads.append(DependencyContent(target, normalized))
     return build_content_snapshot(rows, payloads)
 
@@ -10,12 +10,29 @@ from orchestrator.deps.content_snapshot import (
     DependencyContent,
     DependencyContentSnapshot,
     build_content_snapshot,
+    read_normalized_utf8_many,
     render_content_snapshot,
 )
 
 # Size limits per spec
 MAX_INJECTION_SIZE = MAX_INJECTION_BYTES
 
+# Default instruction text keyed by (mode, is_required)
+_DEFAULT_INSTRUCTIONS = {
+    ('list', True): "The following required files are available:",
+    ('list', False): "The following optional files are available:",
+    ('content', True): "Content from required dependencies:",
+    ('content', False): "Content from optional dependencies:",
+}
+
+
+def _exists(path: Path) -> bool:
+    """Return whether path exists, treating unreadable or invalid paths as absent."""
+    try:
+        return path.exists()
+    except (OSError, ValueError):
+        return False
+
 
 @dataclass 
 class InjectionResult:
@@ -126,14 +143,11 @@ class DependencyInjector:
         Returns:
             Default instruction text
         """
-        dep_type = "required" if is_required else "optional"
-        
-        if mode == 'list':
-            return f"The following {dep_type} files are available:"
-        elif mode == 'content':
-            return f"Content from {dep_type} dependencies:"
-        else:
-            return f"Dependencies ({dep_type}):"
+        instruction = _DEFAULT_INSTRUCTIONS.get((mode, bool(is_required)))
+        if instruction is None:
+            dep_type = "required" if is_required else "optional"
+            instruction = f"Dependencies ({dep_type}):"
+        return instruction
             
     def _generate_list_injection(
         self, 
@@ -150,43 +164,32 @@ class DependencyInjector:
             Tuple of (injection_content, was_truncated, truncation_details)
         """
         lines = [instruction]
+        # Bytes of the joined block so far; each line adds "  - <path>" plus its "\n"
+        total_size = len(instruction.encode('utf-8'))
         
         for file_path in files:
-            lines.append(f"  - {file_path}")
+            path_size = len(file_path) if file_path.isascii() else len(file_path.encode('utf-8'))
+            total_size += path_size + 5
             
-        content = "\n".join(lines)
-        
-        # Check size limit
-        if len(content.encode('utf-8')) > MAX_INJECTION_SIZE:
-            # Truncate file list
-            truncated_lines = [instruction]
-            total_size = len(instruction.encode('utf-8'))
-            files_shown = 0
-            
-            for file_path in files:
-                line = f"  - {file_path}\n"
-                line_size = len(line.encode('utf-8'))
+            # Check size limit
+            if total_size > MAX_INJECTION_SIZE:
+                # Truncate file list at the first line that does not fit
+                files_shown = len(lines) - 1
+                lines.append(f"  ... ({len(files) - files_shown} files omitted due to size limit)")
                 
-                if total_size + line_size > MAX_INJECTION_SIZE:
-                    break
-                    
-                truncated_lines.append(f"  - {file_path}")
-                total_size += line_size
-                files_shown += 1
+                return (
+                    "\n".join(lines),
+                    True,
+                    {
+                        "total_files": len(files),
+                        "files_shown": files_shown,
+                        "files_omitted": len(files) - files_shown
+                    }
+                )
                 
-            truncated_lines.append(f"  ... ({len(files) - files_shown} files omitted due to size limit)")
-            
-            return (
-                "\n".join(truncated_lines),
-                True,
-                {
-                    "total_files": len(files),
-                    "files_shown": files_shown,
-                    "files_omitted": len(files) - files_shown
-                }
-            )
+            lines.append(f"  - {file_path}")
             
-        return content, False, None
+        return "\n".join(lines), False, None
         
     def _generate_content_injection(
         self,
@@ -234,19 +237,22 @@ class DependencyInjector:
         rows: list[AuthoredDependencyRow] = []
         payload_by_target: dict[str, DependencyContent] = {}
 
-        for authored_index, file_path in enumerate(files):
-            full_path = self.workspace / file_path
+        full_paths = [self.workspace / file_path for file_path in files]
+        present = list(dict.fromkeys(full_path for full_path in full_paths if _exists(full_path)))
+        contents = dict(zip(present, read_normalized_utf8_many(present)))
+
+        for authored_index, (file_path, full_path) in enumerate(zip(files, full_paths)):
             canonical_target: str | None = None
-            try:
-                if full_path.exists():
-                    normalized = full_path.read_text(encoding="utf-8").encode("utf-8")
+            normalized = contents.get(full_path)
+            if isinstance(normalized, bytes):
+                try:
                     canonical_target = full_path.resolve().relative_to(self.workspace).as_posix()
                     payload_by_target.setdefault(
                         canonical_target,
                         DependencyContent(canonical_target, normalized),
                     )
-            except Exception:
-                canonical_target = None
+                except Exception:
+                    canonical_target = None
 
             rows.append(
                 AuthoredDependencyRow(
@@ -1,15 +1,38 @@
 """Dependency resolution with glob matching and validation."""
 
+import fnmatch
+from functools import lru_cache
 import glob
 import os
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Iterable
+from pathlib import Path, PurePosixPath
+import re
+import stat
+from typing import Callable, Dict, List, Optional, Tuple, Any, Iterable
 from dataclasses import dataclass, field
 
 from orchestrator.deps.content_snapshot import AuthoredDependencyRow
 from orchestrator.variables.substitution import VariableSubstitutor
 
 
+@lru_cache(maxsize=512)
+def _compile_segment(segment: str) -> Callable[[str], Any]:
+    """Compile one wildcard path segment to a case-sensitive name matcher."""
+    return re.compile(fnmatch.translate(segment)).match
+
+
+def _scan_directory(directory: str, listings: Dict[str, List[os.DirEntry]]) -> List[os.DirEntry]:
+    """Return the entries of ``directory``, reading each directory at most once per listings map."""
+    entries = listings.get(directory)
+    if entries is None:
+        try:
+            with os.scandir(directory) as iterator:
+                entries = list(iterator)
+        except OSError:
+            entries = []
+        listings[directory] = entries
+    return entries
+
+
 @dataclass
 class DependencyResolution:
     """Results of dependency resolution."""
@@ -59,7 +82,8 @@ class DependencyResolver:
         Raises:
             ValueError: If required files are missing (exit code 2)
         """
-        if not depends_on:
+        # Nothing to resolve: skip substitution, path checks, and directory reads
+        if not depends_on or not (depends_on.get('required') or depends_on.get('optional')):
             return DependencyResolution(
                 required_files=[],
                 optional_files=[],
@@ -69,13 +93,16 @@ class DependencyResolver:
             )
             
         variables = variables or {}
+        # Directory listings shared by every pattern in this call
+        listings: Dict[str, List[os.DirEntry]] = {}
         
         # Process required dependencies
         required_patterns = depends_on.get('required', [])
         required_files, required_patterns_used, missing_required, required_rows = self._resolve_patterns(
             required_patterns, 
             variables, 
-            required=True
+            required=True,
+            listings=listings,
         )
         
         # Process optional dependencies  
@@ -83,7 +110,8 @@ class DependencyResolver:
         optional_files, optional_patterns_used, _, optional_rows = self._resolve_patterns(
             optional_patterns,
             variables,
-            required=False
+            required=False,
+            listings=listings,
         )
         
         # Combine pattern tracking
@@ -165,7 +193,8 @@ class DependencyResolver:
         self, 
         patterns: List[str], 
         variables: Dict[str, str],
-        required: bool
+        required: bool,
+        listings: Optional[Dict[str, List[os.DirEntry]]] = None,
     ) -> Tuple[List[str], Dict[str, List[str]], List[str], List[AuthoredDependencyRow]]:
         """Resolve glob patterns to file paths.
         
@@ -173,6 +202,7 @@ class DependencyResolver:
             patterns: List of glob patterns (may contain variables)
             variables: Variables for substitution
             required: Whether these are required dependencies
+            listings: Directory listings to reuse across patterns
             
         Returns:
             Tuple of (matched_files, patterns_used_dict, missing_patterns, classified_rows)
@@ -182,6 +212,8 @@ class DependencyResolver:
         missing_patterns = []
         classified_rows: List[AuthoredDependencyRow] = []
         role = "required" if required else "optional"
+        if listings is None:
+            listings = {}
         
         for pattern in patterns:
             # Substitute variables in pattern
@@ -190,18 +222,17 @@ class DependencyResolver:
             # Validate path safety
             self._validate_path_safety(expanded_pattern)
             
-            # Resolve pattern relative to workspace
-            full_pattern = self.workspace / expanded_pattern
-            
-            # Use glob to match files (follows POSIX semantics)
-            # Note: glob.glob follows symlinks by default
-            matches = glob.glob(str(full_pattern), recursive=False)  # No ** support in v1.1
+            # Match relative to workspace (POSIX semantics, symlinks followed,
+            # no ** support in v1.1)
+            matches = self._expand_pattern(expanded_pattern, listings)
             
             # Convert back to relative paths and sort for deterministic ordering
             relative_matches = []
             classified_matches: List[tuple[str, str]] = []
-            for match in matches:
-                match_path = Path(match).resolve()
+            for match, via_symlink in matches:
+                # Only paths that crossed a symlink can leave the workspace or
+                # differ from their lexical form; everything else skips realpath
+                match_path = Path(match).resolve() if via_symlink else Path(match)
                 
                 # Check symlink doesn't escape workspace
                 if not str(match_path).startswith(str(self.workspace)):
@@ -263,6 +294,59 @@ class DependencyResolver:
                 
         return unique_files, patterns_used, missing_patterns, classified_rows
         
+    def _expand_pattern(
+        self, pattern: str, listings: Dict[str, List[os.DirEntry]]
+    ) -> List[Tuple[str, bool]]:
+        """Expand a workspace-relative pattern the way ``glob.glob(recursive=False)`` would.
+
+        Wildcard segments are matched against one ``os.scandir`` listing per
+        directory (shared through ``listings``) instead of a stat per entry.
+        As with glob, dot-entries only match segments that start with '.',
+        and intermediate wildcard segments only match directories.
+
+        Returns:
+            ``(path, via_symlink)`` pairs; ``via_symlink`` is True when any
+            component after the workspace root may be a symlink.
+        """
+        workspace = str(self.workspace)
+        # Normalize like the former ``self.workspace / pattern`` join: trailing
+        # and repeated separators and '.' components are dropped.
+        segments = PurePosixPath(pattern).parts
+        if not glob.has_magic(pattern):
+            path = os.path.join(workspace, *segments)
+            return [(path, True)] if os.path.lexists(path) else []
+
+        candidates = [(workspace, False)]
+        for index, segment in enumerate(segments):
+            is_last = index == len(segments) - 1
+            next_candidates = []
+            if glob.has_magic(segment):
+                match = _compile_segment(segment)
+                include_hidden = segment.startswith('.')
+                for directory, via_symlink in candidates:
+                    for entry in _scan_directory(directory, listings):
+                        name = entry.name
+                        if not include_hidden and name.startswith('.'):
+                            continue
+                        if match(name) and (is_last or entry.is_dir()):
+                            next_candidates.append((entry.path, via_symlink or entry.is_symlink()))
+            else:
+                for directory, via_symlink in candidates:
+                    path = os.path.join(directory, segment)
+                    try:
+                        mode = os.lstat(path).st_mode
+                    except OSError:
+                        continue
+                    if stat.S_ISLNK(mode):
+                        if is_last or os.path.isdir(path):
+                            next_candidates.append((path, True))
+                    elif is_last or stat.S_ISDIR(mode):
+                        next_candidates.append((path, via_symlink))
+            candidates = next_candidates
+            if not candidates:
+                break
+        return candidates
+
     def _substitute_variables(self, pattern: str, variables: Dict[str, str]) -> str:
         """Substitute variables in pattern.
         
@@ -273,6 +357,9 @@ class DependencyResolver:
         Returns:
             Pattern with variables substituted
         """
+        if '$' not in pattern:
+            # No ${...} reference or $$ escape: substitution is the identity
+            return pattern
         substitutor = VariableSubstitutor()
         try:
             return str(substitutor.substitute(pattern, variables))
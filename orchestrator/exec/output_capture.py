@@ -24,7 +24,7 @@ class CaptureMode(str, Enum):
     JSON = "json"
 
 
-@dataclass
+@dataclass(slots=True)
 class CaptureResult:
     """Result of output capture processing."""
     mode: CaptureMode
@@ -138,6 +138,10 @@ class OutputCapture:
             output_file.parent.mkdir(parents=True, exist_ok=True)
             output_file.write_bytes(stdout)
 
+        # Lines mode decodes only the lines it keeps
+        if mode == CaptureMode.LINES:
+            return self._capture_lines(stdout, step_name, exit_code)
+
         # Decode stdout for processing
         try:
             stdout_text = stdout.decode('utf-8', errors='replace')
@@ -147,8 +151,6 @@ class OutputCapture:
         # Process based on mode
         if mode == CaptureMode.TEXT:
             return self._capture_text(stdout_text, stdout, step_name, exit_code)
-        elif mode == CaptureMode.LINES:
-            return self._capture_lines(stdout_text, stdout, step_name, exit_code)
         elif mode == CaptureMode.JSON:
             return self._capture_json(stdout_text, stdout, step_name, allow_parse_error, exit_code)
         else:
@@ -182,24 +184,31 @@ class OutputCapture:
             exit_code=exit_code,
         )
 
-    def _capture_lines(self, text: str, raw_stdout: bytes, step_name: str, exit_code: int) -> CaptureResult:
+    def _capture_lines(self, raw_stdout: bytes, step_name: str, exit_code: int) -> CaptureResult:
         """
         Capture lines mode with 10,000 line limit (AT-1).
         Normalizes CRLF to LF per spec.
         """
+        # Cut the raw bytes after the last kept line before decoding, so the
+        # discarded tail is never decoded or split. Newline bytes never occur
+        # inside a multi-byte UTF-8 sequence, so the cut cannot split one.
+        head = raw_stdout
+        truncated = False
+        if raw_stdout.count(b'\n') >= self.LINES_LIMIT:
+            rest = raw_stdout.split(b'\n', self.LINES_LIMIT)[-1]
+            if rest:
+                truncated = True
+                head = raw_stdout[:len(raw_stdout) - len(rest)]
+
         # Normalize line endings and split
-        text = text.replace('\r\n', '\n')
+        text = head.decode('utf-8', errors='replace').replace('\r\n', '\n')
         lines = text.split('\n')
 
         # Remove empty trailing line if present
         if lines and lines[-1] == '':
             lines = lines[:-1]
 
-        truncated = False
-        if len(lines) > self.LINES_LIMIT:
-            truncated = True
-            lines = lines[:self.LINES_LIMIT]
-
+        if truncated:
             # Write full output to logs
             stdout_file = self._log_file(step_name, "stdout")
             stdout_file.parent.mkdir(parents=True, exist_ok=True)
@@ -4,19 +4,24 @@ Implements basic command execution with output capture.
 """
 
 import os
+import re
 import subprocess
 import shlex
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .output_capture import OutputCapture, CaptureMode, CaptureResult
-from ..fsq.wait import WaitFor, WaitForConfig
+from ..fsq.wait import WaitFor, WaitForConfig, WaitForResult
 from ..security.secrets import SecretsManager
 
+# Anything shlex treats specially (quotes, escapes) or whitespace it does not
+# split on; commands without these tokenize identically with str.split().
+_SHLEX_SPECIAL = re.compile(r'[\'"\\]|[^\S \t\r\n]')
 
-@dataclass
+
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of step execution."""
     step_name: str
@@ -37,6 +42,26 @@ class ExecutionResult:
         return result
 
 
+@dataclass(slots=True)
+class WaitForExecutionResult(ExecutionResult):
+    """Result of a wait_for step, recorded with wait-specific state (AT-19)."""
+    wait_result: WaitForResult = field(kw_only=True)
+
+    def to_state_dict(self) -> Dict[str, Any]:
+        """Convert to state format for recording."""
+        wait_result = self.wait_result
+        state: Dict[str, Any] = {
+            "exit_code": wait_result.exit_code,
+            "files": wait_result.files,
+            "wait_duration_ms": wait_result.wait_duration_ms,
+            "poll_count": wait_result.poll_count,
+            "timed_out": wait_result.timed_out
+        }
+        if self.error:
+            state["error"] = self.error
+        return state
+
+
 class StepExecutor:
     """
     Executes workflow steps with output capture.
@@ -127,7 +152,10 @@ class StepExecutor:
         # Convert command to argv array if needed
         if isinstance(command, str):
             # Parse shell command into argv array using shlex for proper quoting/escaping
-            command_argv = shlex.split(command)
+            if _SHLEX_SPECIAL.search(command) is None:
+                command_argv = command.split()
+            else:
+                command_argv = shlex.split(command)
         elif isinstance(command, list):
             # Already an argv array
             command_argv = command
@@ -136,14 +164,20 @@ class StepExecutor:
 
         self._ensure_orchestrator_module_on_pythonpath(command_argv, process_env)
 
+        # When the composed environment matches os.environ, let the child
+        # inherit it rather than passing a full copy for every command.
+        run_kwargs: Dict[str, Any] = {}
+        if process_env != os.environ:
+            run_kwargs["env"] = process_env
+
         try:
             # Execute command using argv mode (no shell=True for security)
             result = subprocess.run(
                 command_argv,
                 cwd=str(working_dir),
-                env=process_env,
                 capture_output=True,
                 timeout=timeout_sec,
+                **run_kwargs,
             )
 
             exit_code = result.returncode
@@ -295,28 +329,11 @@ class StepExecutor:
             }
 
         # Create result with wait-specific state (AT-19)
-        result = ExecutionResult(
+        return WaitForExecutionResult(
             step_name=step_name,
             exit_code=wait_result.exit_code,
             capture_result=capture_result,
             duration_ms=wait_result.wait_duration_ms,
-            error=error
+            error=error,
+            wait_result=wait_result,
         )
-
-        # Add wait-specific fields to the state dict
-        def to_wait_state_dict() -> Dict[str, Any]:
-            state: Dict[str, Any] = {
-                "exit_code": wait_result.exit_code,
-                "files": wait_result.files,
-                "wait_duration_ms": wait_result.wait_duration_ms,
-                "poll_count": wait_result.poll_count,
-                "timed_out": wait_result.timed_out
-            }
-            if error:
-                state["error"] = error
-            return state
-
-        # Override to_state_dict for wait results
-        result.to_state_dict = to_wait_state_dict
-
-        return result
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Iterable, Mapping, Sequence
 from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from hashlib import sha256
 from importlib import resources
 import json
@@ -184,6 +185,17 @@ def load_provider_isolation_schema(resource_name: str) -> dict[str, Any]:
     return value
 
 
+@lru_cache(maxsize=None)
+def provider_isolation_schema_validator(resource_name: str) -> Draft202012Validator:
+    """Return the shared validator for one packaged provider-isolation schema.
+
+    Packaged schemas are immutable, so each one is read and compiled once
+    per process instead of on every validation.
+    """
+
+    return Draft202012Validator(load_provider_isolation_schema(resource_name))
+
+
 def canonical_isolation_json_bytes(value: Any) -> bytes:
     """Encode one closed isolation record using the shared canonical contract."""
 
@@ -226,8 +238,7 @@ def validate_provider_phase_isolation_policy(
 ) -> tuple[ProviderIsolationIssue, ...]:
     """Return every deterministic schema, semantic, and identity issue."""
 
-    schema = load_provider_isolation_schema(POLICY_SCHEMA_RESOURCE)
-    validator = Draft202012Validator(schema)
+    validator = provider_isolation_schema_validator(POLICY_SCHEMA_RESOURCE)
     issues = _schema_validation_issues(validator.iter_errors(document))
     issues.extend(_policy_float_issues(document, "$"))
 
@@ -671,6 +682,7 @@ __all__ = [
     "isolation_schema_validation_issues",
     "load_provider_isolation_schema",
     "load_provider_phase_isolation_policy",
+    "provider_isolation_schema_validator",
     "select_provider_isolation_backend",
     "validate_provider_phase_isolation_policy",
 ]
@@ -12,12 +12,10 @@ import stat
 from typing import Any, Literal, Mapping, Protocol
 import unicodedata
 
-from jsonschema import Draft202012Validator
-
 from orchestrator.providers.isolation import (
     MAX_PROVIDER_ISOLATION_RUNTIME_RELPATH_LENGTH,
     canonical_isolation_json_bytes,
-    load_provider_isolation_schema,
+    provider_isolation_schema_validator,
 )
 from orchestrator.providers.isolation_runtime_authority import (
     MAX_RUNTIME_AUTHORITY_DIRECTORY_DEPTH,
@@ -2177,9 +2175,9 @@ def _file_identity(
 
 
 def _canonical_validated_journal(document: Mapping[str, Any]) -> bytes:
-    schema = load_provider_isolation_schema(_TRANSFER_SCHEMA_RESOURCE)
+    validator = provider_isolation_schema_validator(_TRANSFER_SCHEMA_RESOURCE)
     errors = sorted(
-        Draft202012Validator(schema).iter_errors(document),
+        validator.iter_errors(document),
         key=lambda error: (
             tuple(str(part) for part in error.absolute_path),
             error.message,
@@ -30,13 +30,11 @@ from typing import Any
 import unicodedata
 import uuid
 
-from jsonschema import Draft202012Validator
-
 from .isolation import (
     ProviderIsolationIssue,
     canonical_isolation_json_bytes,
     isolation_schema_validation_issues,
-    load_provider_isolation_schema,
+    provider_isolation_schema_validator,
 )
 
 
@@ -3331,8 +3329,7 @@ def validate_provider_environment_manifest(
 ) -> tuple[ProviderIsolationIssue, ...]:
     """Return every deterministic structural, semantic, and identity issue."""
 
-    schema = load_provider_isolation_schema(ENVIRONMENT_SCHEMA_RESOURCE)
-    validator = Draft202012Validator(schema)
+    validator = provider_isolation_schema_validator(ENVIRONMENT_SCHEMA_RESOURCE)
     issues = list(
         isolation_schema_validation_issues(
             validator.iter_errors(document),
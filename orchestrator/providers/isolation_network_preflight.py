@@ -25,13 +25,11 @@ import struct
 from typing import Any
 import unicodedata
 
-from jsonschema import Draft202012Validator
-
 from .isolation import (
     ProviderIsolationIssue,
     canonical_isolation_json_bytes,
     isolation_schema_validation_issues,
-    load_provider_isolation_schema,
+    provider_isolation_schema_validator,
 )
 from .isolation_candidate import REQUIRED_CANDIDATE_AUTHORITY_LABELS
 
@@ -423,10 +421,9 @@ def validate_provider_isolation_network_inventory(
     )
     if semantic_issues:
         return _deduplicate_issues(semantic_issues)
-    schema = load_provider_isolation_schema(
+    validator = provider_isolation_schema_validator(
         NETWORK_INVENTORY_SCHEMA_RESOURCE
     )
-    validator = Draft202012Validator(schema)
     issues = list(
         isolation_schema_validation_issues(
             validator.iter_errors(document),
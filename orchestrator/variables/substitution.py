@@ -5,6 +5,7 @@ Per specs/variables.md.
 """
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, Union
 import json
 
@@ -167,7 +168,9 @@ class VariableSubstitutor:
             return None
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _parse_variable_expression(expression: str) -> tuple[str, tuple[str, ...]]:
+        # Pure in its input; loop bodies re-parse the same expressions per iteration.
         parts = expression.split("|")
         return parts[0], tuple(part for part in parts[1:] if part)
 
@@ -1,9 +1,13 @@
 """Condition evaluation for workflow steps."""
 
 from dataclasses import dataclass
+import fnmatch
+from functools import lru_cache
 import glob
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+import re
+from typing import Any, Callable, Dict, Iterator, Optional
 
 from ..variables.substitution import VariableSubstitutor
 from .predicates import TYPED_PREDICATE_OPERATOR_KEYS, TypedPredicateEvaluator
@@ -35,6 +39,20 @@ class NotExistsConditionNode:
     pattern: str
 
 
+@lru_cache(maxsize=64)
+def _compile_name_pattern(pattern: str) -> Callable[[str], Any]:
+    """Compile one single-segment glob pattern to a case-sensitive name matcher."""
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def _may_substitute(value: Any) -> bool:
+    """Return False when variable substitution would return ``value`` unchanged."""
+    if isinstance(value, str):
+        # Both ${...} references and $$ escapes start with '$'
+        return '$' in value
+    return isinstance(value, (list, dict))
+
+
 def parse_legacy_condition(condition: Any) -> Any:
     """Parse one legacy condition mapping into an immutable typed node."""
     if not isinstance(condition, dict):
@@ -172,14 +190,18 @@ class ConditionEvaluator:
         if 'left' not in equals_cond or 'right' not in equals_cond:
             raise ValueError("equals condition must have 'left' and 'right' keys")
 
-        # Substitute variables in both sides
-        try:
-            left = self.substitutor.substitute(equals_cond['left'], variables)
-            right = self.substitutor.substitute(equals_cond['right'], variables)
-        except ValueError:
-            # Undefined variables make the condition false
-            # This is a runtime condition evaluation, not a validation error
-            return False
+        left = equals_cond['left']
+        right = equals_cond['right']
+
+        # Substitute variables in both sides; literal operands pass through as-is
+        if _may_substitute(left) or _may_substitute(right):
+            try:
+                left = self.substitutor.substitute(left, variables)
+                right = self.substitutor.substitute(right, variables)
+            except ValueError:
+                # Undefined variables make the condition false
+                # This is a runtime condition evaluation, not a validation error
+                return False
 
         # Convert both to strings for comparison
         left_str = self._to_string(left)
@@ -219,8 +241,12 @@ class ConditionEvaluator:
         # Resolve pattern relative to workspace
         full_pattern = self.workspace / pattern
 
-        # Use glob to find matches
-        matches = glob.glob(str(full_pattern))
+        # Top-level wildcard patterns are matched against one directory listing;
+        # anything with a directory component or no wildcard goes through glob.
+        if '/' in pattern or os.sep in pattern or not glob.has_magic(pattern):
+            matches = glob.glob(str(full_pattern))
+        else:
+            matches = self._match_top_level(pattern)
 
         # Follow symlinks and verify they stay within workspace
         for match_path in matches:
@@ -235,6 +261,24 @@ class ConditionEvaluator:
 
         return False
 
+    def _match_top_level(self, pattern: str) -> Iterator[str]:
+        """
+        Yield workspace entries whose names match a single-segment glob pattern.
+
+        Mirrors glob.glob for this case: dot-files only match patterns that
+        themselves start with '.', and a missing workspace yields nothing.
+        """
+        match = _compile_name_pattern(pattern)
+        include_hidden = pattern.startswith('.')
+        try:
+            with os.scandir(self.workspace) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (include_hidden or not name.startswith('.')) and match(name):
+                        yield entry.path
+        except OSError:
+            return
+
     def _evaluate_not_exists(self, pattern: str, variables: Dict[str, Any]) -> bool:
         """
         Evaluate a when.not_exists condition.
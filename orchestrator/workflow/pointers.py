@@ -4,7 +4,8 @@ Implements AT-3, AT-13: Dynamic for-each with items_from pointer resolution.
 """
 
 import re
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 
 class PointerResolver:
@@ -17,6 +18,16 @@ class PointerResolver:
     # Pattern to parse pointer syntax: steps.StepName.field[.nested.path]
     POINTER_PATTERN = re.compile(r'^steps\.([^.]+)\.(.+)$')
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse(pointer: str) -> Optional[Tuple[str, str, Tuple[str, ...]]]:
+        """Split a pointer into (step_name, field_path, path_parts); None if malformed."""
+        match = PointerResolver.POINTER_PATTERN.match(pointer)
+        if not match:
+            return None
+        field_path = match.group(2)
+        return match.group(1), field_path, tuple(field_path.split('.'))
+
     def __init__(self, state: Dict[str, Any]):
         """
         Initialize pointer resolver with execution state.
@@ -39,17 +50,34 @@ class PointerResolver:
         Raises:
             ValueError: If pointer is invalid or doesn't resolve to a value
         """
-        match = self.POINTER_PATTERN.match(pointer)
-        if not match:
-            raise ValueError(f"Invalid pointer syntax: {pointer}")
+        ok, value, error = self.resolve_safe(pointer)
+        if not ok:
+            raise ValueError(error)
+        return value
 
-        step_name = match.group(1)
-        field_path = match.group(2)
+    def resolve_safe(self, pointer: str) -> tuple[bool, Any, Optional[str]]:
+        """
+        Safely resolve a pointer, returning success status and error message.
+
+        Failures are reported in the tuple rather than raised, so callers
+        probing pointers do not pay for exception handling.
+
+        Args:
+            pointer: Pointer string to resolve
+
+        Returns:
+            (success, value, error_message) tuple
+        """
+        parsed = self._parse(pointer)
+        if parsed is None:
+            return False, None, f"Invalid pointer syntax: {pointer}"
+
+        step_name, field_path, path_parts = parsed
 
         # Get step results from state
         steps = self.state.get('steps', {})
         if step_name not in steps:
-            raise ValueError(f"Step '{step_name}' not found in state")
+            return False, None, f"Step '{step_name}' not found in state"
 
         step_data = steps[step_name]
 
@@ -57,53 +85,32 @@ class PointerResolver:
         # If step_name contains [i], it's a loop iteration reference
         if '[' in step_name:
             # This is handled by the executor for loop-scoped resolution
-            raise ValueError(f"Loop iteration references not supported in items_from: {pointer}")
-
-        # Parse the field path
-        path_parts = field_path.split('.')
-        if not path_parts:
-            raise ValueError(f"Invalid field path in pointer: {pointer}")
+            return False, None, f"Loop iteration references not supported in items_from: {pointer}"
 
         # First part must be 'lines' or 'json'
         first = path_parts[0]
 
         if first == 'lines':
             if len(path_parts) != 1:
-                raise ValueError(f"'lines' cannot have nested paths: {pointer}")
+                return False, None, f"'lines' cannot have nested paths: {pointer}"
             if 'lines' not in step_data:
-                raise ValueError(f"Step '{step_name}' does not have 'lines' output")
-            return step_data['lines']
+                return False, None, f"Step '{step_name}' does not have 'lines' output"
+            return True, step_data['lines'], None
 
         elif first == 'json':
             if 'json' not in step_data:
-                raise ValueError(f"Step '{step_name}' does not have 'json' output")
+                return False, None, f"Step '{step_name}' does not have 'json' output"
 
             # Navigate nested JSON path
             result = step_data['json']
             for part in path_parts[1:]:  # Skip 'json' itself
                 if not isinstance(result, dict):
-                    raise ValueError(f"Cannot navigate path '{field_path}' - '{part}' is not an object")
+                    return False, None, f"Cannot navigate path '{field_path}' - '{part}' is not an object"
                 if part not in result:
-                    raise ValueError(f"Path '{field_path}' not found - missing key '{part}'")
+                    return False, None, f"Path '{field_path}' not found - missing key '{part}'"
                 result = result[part]
 
-            return result
+            return True, result, None
 
         else:
-            raise ValueError(f"Invalid output field '{first}' - must be 'lines' or 'json'")
-
-    def resolve_safe(self, pointer: str) -> tuple[bool, Any, Optional[str]]:
-        """
-        Safely resolve a pointer, returning success status and error message.
-
-        Args:
-            pointer: Pointer string to resolve
-
-        Returns:
-            (success, value, error_message) tuple
-        """
-        try:
-            value = self.resolve(pointer)
-            return True, value, None
-        except ValueError as e:
-            return False, None, str(e)
\ No newline at end of file
+            return False, None, f"Invalid output field '{first}' - must be 'lines' or 'json'"
\ No newline at end of file
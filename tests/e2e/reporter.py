@@ -11,6 +11,24 @@ import sys
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+_SECTION_RULE = "=" * 60
+_SUBSECTION_RULE = "-" * 40
+
+
+def _walk_files(root: str):
+    """Yield (path, size) for regular files under root, reusing DirEntry stat data.
+
+    Dot-files and dot-directories are skipped, as glob's ``**/*`` did.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path, entry.stat().st_size
+
 
 class E2ETestReporter:
     """Reporter for displaying agent I/O during E2E tests."""
@@ -30,17 +48,13 @@ class E2ETestReporter:
         """Print a section header."""
         if not self.enabled:
             return
-        print(f"\n{'=' * 60}")
-        print(f"  {title}")
-        print(f"{'=' * 60}")
+        sys.stdout.write(f"\n{_SECTION_RULE}\n  {title}\n{_SECTION_RULE}\n")
 
     def subsection(self, title: str) -> None:
         """Print a subsection header."""
         if not self.enabled:
             return
-        print(f"\n{'-' * 40}")
-        print(f"  {title}")
-        print(f"{'-' * 40}")
+        sys.stdout.write(f"\n{_SUBSECTION_RULE}\n  {title}\n{_SUBSECTION_RULE}\n")
 
     def info(self, message: str, indent: int = 0) -> None:
         """Print an info message."""
@@ -80,16 +94,8 @@ class E2ETestReporter:
         lines = output.splitlines()
         if len(output) > truncate:
             # Show first and last parts
-            head_lines = lines[:10]
-            tail_lines = lines[-10:]
-            for line in head_lines:
-                self.info(line, 1)
-            self.info(f"... ({len(lines) - 20} lines omitted) ...", 1)
-            for line in tail_lines:
-                self.info(line, 1)
-        else:
-            for line in lines:
-                self.info(line, 1)
+            lines = lines[:10] + [f"... ({len(lines) - 20} lines omitted) ..."] + lines[-10:]
+        sys.stdout.write("".join(f"{self.indent}{line}\n" for line in lines))
 
     def state_update(self, step_name: str, state: Dict[str, Any]) -> None:
         """Display state update for a step."""
@@ -108,18 +114,21 @@ class E2ETestReporter:
                 elif isinstance(output, dict):
                     self.info(f"Output keys: {', '.join(output.keys())}", 1)
 
-    def artifacts(self, workspace: Path, pattern: str = "artifacts/**/*") -> None:
-        """Display created artifacts."""
+    def artifacts(self, workspace: Path, subdir: str = "artifacts") -> None:
+        """Display created artifacts.
+
+        Args:
+            workspace: Workspace root the artifact paths are reported against
+            subdir: Directory under the workspace to list recursively
+        """
         if not self.enabled:
             return
-        import glob
-        artifacts = glob.glob(str(workspace / pattern), recursive=True)
-        artifacts = [f for f in artifacts if Path(f).is_file()]
+        root = workspace / subdir
+        artifacts = sorted(_walk_files(str(root))) if root.is_dir() else []
         if artifacts:
             self.subsection("Created Artifacts")
-            for artifact in sorted(artifacts):
+            for artifact, size in artifacts:
                 rel_path = Path(artifact).relative_to(workspace)
-                size = Path(artifact).stat().st_size
                 self.info(f"{rel_path} ({size} bytes)", 1)
 
     def run_workflow_with_reporting(
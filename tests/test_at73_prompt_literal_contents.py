@@ -7,152 +7,62 @@ Test AT-73: Prompt literal contents
 
 import json
 import pytest
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock, MagicMock, patch
 import subprocess
 
+from orchestrator.providers.executor import ProviderExecutionResult
 from orchestrator.workflow.executor import WorkflowExecutor
 from orchestrator.state import StateManager
 from tests.workflow_bundle_helpers import load_workflow_bundle_for_test
 
 
-class TestPromptLiteralContents:
-    """Test that input_file contents are passed literally without variable substitution (AT-73)"""
+# Shared across fake provider calls; the executor only reads the result.
+_PROVIDER_OK = ProviderExecutionResult(exit_code=0, stdout=b"output", stderr=b"", duration_ms=10)
 
-    def test_at73_argv_mode_literal_prompt(self, tmp_path):
-        """Provider with argv mode receives literal prompt content - no variable substitution"""
-        # Prepare workspace with prompt containing variable syntax
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
 
-        prompt_dir = workspace / "prompts"
-        prompt_dir.mkdir()
+@pytest.fixture
+def fake_run(monkeypatch):
+    """Replace subprocess.run with a recorder; yields the list of (cmd tuple, kwargs) calls.
 
-        # Create prompt file with variable-like syntax that should NOT be substituted
-        prompt_file = prompt_dir / "test.md"
-        prompt_content = "Process this ${context.project} with ${steps.previous.output} and ${undefined.var}"
-        prompt_file.write_text(prompt_content)
+    stdin input is echoed back on stdout, like `cat`.
+    """
+    calls = []
 
-        # Create workflow
-        workflow = {
-            'version': '1.1',
-            'context': {
-                'project': 'test-project'
-            },
-            'providers': {
-                'test-provider': {
-                    'command': ['echo', 'Provider', 'output:', '${PROMPT}'],
-                    'input_mode': 'argv',
-                    'defaults': {}
-                }
-            },
-            'steps': [
-                {
-                    'name': 'TestStep',
-                    'provider': 'test-provider',
-                    'input_file': 'prompts/test.md',
-                    'output_capture': 'text'
-                }
-            ]
-        }
+    def _run(cmd, **kwargs):
+        calls.append((tuple(cmd), kwargs))
+        return subprocess.CompletedProcess(cmd, 0, kwargs.get('input') or b"output", b"")
 
-        # Save workflow to file
-        workflow_path = workspace / 'workflow.yaml'
-        with open(workflow_path, 'w') as f:
-            json.dump(workflow, f)
+    monkeypatch.setattr(subprocess, 'run', _run)
+    return calls
 
-        # Create executor
-        state_manager = StateManager(
-            workspace=workspace,
-            run_id='test-run'
-        )
-        state_manager.initialize('workflow.yaml', {'project': 'test-project'})
-
-        executor = WorkflowExecutor(
-            workflow=load_workflow_bundle_for_test(workspace, workflow_path),
-            workspace=workspace,
-            state_manager=state_manager,
-            debug=False,
-            provider_observation_enabled=False,
-        )
 
-        # Mock subprocess.run to capture the exact command
-        captured_command = []
-        def mock_run(cmd, **kwargs):
-            captured_command.clear()
-            captured_command.extend(cmd)
-            result = MagicMock()
-            result.returncode = 0
-            result.stdout = b"mocked output"
-            result.stderr = b""
-            return result
-
-        with patch('subprocess.run', side_effect=mock_run):
-            result = executor.execute()
-
-        # Verify the prompt was passed literally
-        assert result['status'] == 'completed'
+def _recording_provider(invocations):
+    """Provider execute stand-in that records each invocation and succeeds."""
+    def _execute(invocation):
+        invocations.append(invocation)
+        return _PROVIDER_OK
+    return _execute
 
-        # The command should have the literal prompt content in place of ${PROMPT}
-        assert len(captured_command) == 4
-        assert captured_command[0] == 'echo'
-        assert captured_command[1] == 'Provider'
-        assert captured_command[2] == 'output:'
-        # This is the key assertion - prompt should be literal, with ${...} intact
-        assert captured_command[3] == prompt_content
-        assert '${context.project}' in captured_command[3]
-        assert '${steps.previous.output}' in captured_command[3]
-        assert '${undefined.var}' in captured_command[3]
 
-    def test_at73_stdin_mode_literal_prompt(self, tmp_path):
-        """Provider with stdin mode receives literal prompt content - no variable substitution"""
-        # Prepare workspace with prompt containing variable syntax
+@pytest.fixture
+def make_executor(tmp_path):
+    """Build a WorkflowExecutor over a fresh workspace seeded with `files`."""
+    def _make(workflow, files=None, context=None, provider_fake=None):
         workspace = tmp_path / "workspace"
-        workspace.mkdir()
-
-        prompt_dir = workspace / "prompts"
-        prompt_dir.mkdir()
-
-        # Create prompt file with variable-like syntax that should NOT be substituted
-        prompt_file = prompt_dir / "test.md"
-        prompt_content = "Analyze ${context.data} using ${loop.index} and ${item}"
-        prompt_file.write_text(prompt_content)
-
-        # Create workflow
-        workflow = {
-            'version': '1.1',
-            'context': {
-                'data': 'important-data'
-            },
-            'providers': {
-                'stdin-provider': {
-                    'command': ['cat'],  # Just echo stdin
-                    'input_mode': 'stdin',
-                    'defaults': {}
-                }
-            },
-            'steps': [
-                {
-                    'name': 'StdinStep',
-                    'provider': 'stdin-provider',
-                    'input_file': 'prompts/test.md',
-                    'output_capture': 'text'
-                }
-            ]
-        }
+        workspace.mkdir(exist_ok=True)
+        for rel_path, content in (files or {}).items():
+            path = workspace / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
 
-        # Save workflow to file
+        # JSON is valid YAML, so the loader reads this unchanged
         workflow_path = workspace / 'workflow.yaml'
-        with open(workflow_path, 'w') as f:
-            json.dump(workflow, f)
+        workflow_path.write_text(json.dumps(workflow))
 
-        # Create executor
         state_manager = StateManager(
             workspace=workspace,
             run_id='test-run'
         )
-        state_manager.initialize('workflow.yaml', {'data': 'important-data'})
+        state_manager.initialize('workflow.yaml', context or {})
 
         executor = WorkflowExecutor(
             workflow=load_workflow_bundle_for_test(workspace, workflow_path),
@@ -161,123 +71,166 @@ class TestPromptLiteralContents:
             debug=False,
             provider_observation_enabled=False,
         )
+        if provider_fake is not None:
+            executor.provider_executor.execute = provider_fake
+        return executor, workspace
+    return _make
+
+
+ARGV_PROMPT = "Process this ${context.project} with ${steps.previous.output} and ${undefined.var}"
+ARGV_WORKFLOW = {
+    'version': '1.1',
+    'context': {
+        'project': 'test-project'
+    },
+    'providers': {
+        'test-provider': {
+            'command': ['echo', 'Provider', 'output:', '${PROMPT}'],
+            'input_mode': 'argv',
+            'defaults': {}
+        }
+    },
+    'steps': [
+        {
+            'name': 'TestStep',
+            'provider': 'test-provider',
+            'input_file': 'prompts/test.md',
+            'output_capture': 'text'
+        }
+    ]
+}
+
+
+STDIN_PROMPT = "Analyze ${context.data} using ${loop.index} and ${item}"
+STDIN_WORKFLOW = {
+    'version': '1.1',
+    'context': {
+        'data': 'important-data'
+    },
+    'providers': {
+        'stdin-provider': {
+            'command': ['cat'],  # Just echo stdin
+            'input_mode': 'stdin',
+            'defaults': {}
+        }
+    },
+    'steps': [
+        {
+            'name': 'StdinStep',
+            'provider': 'stdin-provider',
+            'input_file': 'prompts/test.md',
+            'output_capture': 'text'
+        }
+    ]
+}
+
+
+INJECTION_PROMPT = "Use ${context.model} to process ${steps.data.output}"
+INJECTION_WORKFLOW = {
+    'version': '1.1.1',  # Required for injection
+    'context': {
+        'model': 'gpt-4'
+    },
+    'providers': {
+        'test-provider': {
+            'command': ['echo', '${PROMPT}'],
+            'input_mode': 'argv',
+            'defaults': {}
+        }
+    },
+    'steps': [
+        {
+            'name': 'TestWithInjection',
+            'provider': 'test-provider',
+            'input_file': 'prompts/test.md',
+            'depends_on': {
+                'required': ['deps/config.txt'],
+                'inject': True  # Will prepend file list
+            },
+            'output_capture': 'text'
+        }
+    ]
+}
+
+
+COMMAND_WORKFLOW = {
+    'version': '1.1',
+    'context': {
+        'name': 'test-value'
+    },
+    'steps': [
+        {
+            'name': 'CommandStep',
+            'command': ['echo', '${context.name}'],  # Variables in command ARE substituted
+            'output_capture': 'text'
+        }
+    ]
+}
 
-        # Mock subprocess.run to capture the stdin
-        captured_stdin = []
-        def mock_run(cmd, **kwargs):
-            if 'input' in kwargs:
-                captured_stdin.clear()
-                # Input is already bytes from provider executor - decode to check content
-                input_bytes = kwargs['input']
-                captured_stdin.append(input_bytes.decode('utf-8') if isinstance(input_bytes, bytes) else input_bytes)
-            result = MagicMock()
-            result.returncode = 0
-            # Cat echoes stdin - input is already bytes
-            result.stdout = kwargs.get('input', b'') if 'input' in kwargs else b''
-            result.stderr = b""
-            return result
-
-        with patch('subprocess.run', side_effect=mock_run):
-            result = executor.execute()
-
-        # Verify the prompt was passed literally
-        assert result['status'] == 'completed'
-
-        # The stdin should have the literal prompt content
-        assert len(captured_stdin) == 1
-        assert captured_stdin[0] == prompt_content
-        assert '${context.data}' in captured_stdin[0]
-        assert '${loop.index}' in captured_stdin[0]
-        assert '${item}' in captured_stdin[0]
 
-    def test_at73_with_dependency_injection_literal(self, tmp_path):
-        """With dependency injection, original prompt remains literal; injection adds to it"""
-        # Prepare workspace
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
-
-        prompt_dir = workspace / "prompts"
-        prompt_dir.mkdir()
+class TestPromptLiteralContents:
+    """Test that input_file contents are passed literally without variable substitution (AT-73)"""
 
-        deps_dir = workspace / "deps"
-        deps_dir.mkdir()
+    def test_at73_argv_mode_literal_prompt(self, make_executor):
+        """Provider with argv mode receives literal prompt content - no variable substitution"""
+        invocations = []
+        executor, _ = make_executor(
+            ARGV_WORKFLOW,
+            files={'prompts/test.md': ARGV_PROMPT},
+            context={'project': 'test-project'},
+            provider_fake=_recording_provider(invocations),
+        )
 
-        # Create prompt file with variable syntax
-        prompt_file = prompt_dir / "test.md"
-        prompt_content = "Use ${context.model} to process ${steps.data.output}"
-        prompt_file.write_text(prompt_content)
+        result = executor.execute()
 
-        # Create dependency file
-        dep_file = deps_dir / "config.txt"
-        dep_file.write_text("config data")
+        assert result['status'] == 'completed'
+        (invocation,) = invocations
+        # The command should have the literal prompt content in place of ${PROMPT}
+        assert tuple(invocation.command) == ('echo', 'Provider', 'output:', ARGV_PROMPT)
+        # This is the key assertion - prompt should be literal, with ${...} intact
+        prompt = invocation.command[3]
+        assert '${context.project}' in prompt
+        assert '${steps.previous.output}' in prompt
+        assert '${undefined.var}' in prompt
 
-        # Create workflow with injection
-        workflow = {
-            'version': '1.1.1',  # Required for injection
-            'context': {
-                'model': 'gpt-4'
-            },
-            'providers': {
-                'test-provider': {
-                    'command': ['echo', '${PROMPT}'],
-                    'input_mode': 'argv',
-                    'defaults': {}
-                }
-            },
-            'steps': [
-                {
-                    'name': 'TestWithInjection',
-                    'provider': 'test-provider',
-                    'input_file': 'prompts/test.md',
-                    'depends_on': {
-                        'required': ['deps/config.txt'],
-                        'inject': True  # Will prepend file list
-                    },
-                    'output_capture': 'text'
-                }
-            ]
-        }
+    def test_at73_stdin_mode_literal_prompt(self, make_executor, fake_run):
+        """Provider with stdin mode receives literal prompt content - no variable substitution"""
+        # stdin bytes are only produced inside ProviderExecutor.execute, so
+        # check what reaches subprocess.run
+        executor, _ = make_executor(
+            STDIN_WORKFLOW,
+            files={'prompts/test.md': STDIN_PROMPT},
+            context={'data': 'important-data'},
+        )
 
-        # Save workflow to file
-        workflow_path = workspace / 'workflow.yaml'
-        with open(workflow_path, 'w') as f:
-            json.dump(workflow, f)
+        result = executor.execute()
 
-        # Create executor
-        state_manager = StateManager(
-            workspace=workspace,
-            run_id='test-run'
-        )
-        state_manager.initialize('workflow.yaml', {'model': 'gpt-4'})
+        assert result['status'] == 'completed'
+        (captured_stdin,) = [kwargs['input'] for _, kwargs in fake_run if 'input' in kwargs]
+        # The stdin should have the literal prompt content
+        assert captured_stdin == STDIN_PROMPT.encode('utf-8')
+        assert b'${context.data}' in captured_stdin
+        assert b'${loop.index}' in captured_stdin
+        assert b'${item}' in captured_stdin
 
-        executor = WorkflowExecutor(
-            workflow=load_workflow_bundle_for_test(workspace, workflow_path),
-            workspace=workspace,
-            state_manager=state_manager,
-            debug=False,
-            provider_observation_enabled=False,
+    def test_at73_with_dependency_injection_literal(self, make_executor):
+        """With dependency injection, original prompt remains literal; injection adds to it"""
+        invocations = []
+        executor, _ = make_executor(
+            INJECTION_WORKFLOW,
+            files={'prompts/test.md': INJECTION_PROMPT, 'deps/config.txt': "config data"},
+            context={'model': 'gpt-4'},
+            provider_fake=_recording_provider(invocations),
         )
 
-        # Mock subprocess.run to capture the command
-        captured_prompt = []
-        def mock_run(cmd, **kwargs):
-            if len(cmd) >= 2 and cmd[0] == 'echo':
-                captured_prompt.clear()
-                captured_prompt.append(cmd[1])
-            result = MagicMock()
-            result.returncode = 0
-            result.stdout = b"output"
-            result.stderr = b""
-            return result
-
-        with patch('subprocess.run', side_effect=mock_run):
-            result = executor.execute()
+        result = executor.execute()
 
         assert result['status'] == 'completed'
+        (invocation,) = invocations
+        assert invocation.command[0] == 'echo'
 
         # The prompt should have injection PLUS literal content
-        assert len(captured_prompt) == 1
-        final_prompt = captured_prompt[0]
+        final_prompt = invocation.command[1]
 
         # Should have injection header (text may vary)
         assert "deps/config.txt" in final_prompt  # File path should be present
@@ -287,19 +240,21 @@ class TestPromptLiteralContents:
         assert '${context.model}' in final_prompt
         assert '${steps.data.output}' in final_prompt
 
-    def test_at73_loop_context_literal_prompt(self, tmp_path):
-        """In for_each loops, prompt remains literal despite loop variables"""
-        # Prepare workspace
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
+    def test_at73_command_step_no_prompt_substitution(self, make_executor, fake_run):
+        """Command steps don't have input_file, but verify no regression"""
+        executor, _ = make_executor(COMMAND_WORKFLOW, context={'name': 'test-value'})
+
+        result = executor.execute()
 
-        prompt_dir = workspace / "prompts"
-        prompt_dir.mkdir()
+        assert result['status'] == 'completed'
+        # Variables in commands ARE still substituted (this is NOT input_file content)
+        ((captured_command, _),) = fake_run
+        assert captured_command == ('echo', 'test-value')
 
-        # Create prompt with loop variable references
-        prompt_file = prompt_dir / "loop.md"
+    def test_at73_loop_context_literal_prompt(self, make_executor):
+        """In for_each loops, prompt remains literal despite loop variables"""
+        # Prompt with loop variable references
         prompt_content = "Process item ${item} at index ${loop.index} of ${loop.total}"
-        prompt_file.write_text(prompt_content)
 
         # Create workflow with for_each
         workflow = {
@@ -329,48 +284,20 @@ class TestPromptLiteralContents:
             ]
         }
 
-        # Save workflow to file
-        workflow_path = workspace / 'workflow.yaml'
-        with open(workflow_path, 'w') as f:
-            json.dump(workflow, f)
-
-        # Create executor
-        state_manager = StateManager(
-            workspace=workspace,
-            run_id='test-run'
-        )
-        state_manager.initialize('workflow.yaml', {})
-
-        executor = WorkflowExecutor(
-            workflow=load_workflow_bundle_for_test(workspace, workflow_path),
-            workspace=workspace,
-            state_manager=state_manager,
-            debug=False,
-            provider_observation_enabled=False,
-        )
-
-        # Mock the provider executor's execute method directly
         captured_prompts = []
-        original_execute = executor.provider_executor.execute
-
-        from orchestrator.providers.executor import ProviderExecutionResult
 
         def mock_execute(invocation):
             # In argv mode, the prompt content is substituted into the command
             # The command should be ['echo', '<prompt-content>']
             if len(invocation.command) >= 2:
-                prompt_from_command = invocation.command[1]  # Second argument after 'echo'
-                captured_prompts.append(prompt_from_command)
+                captured_prompts.append(invocation.command[1])  # Second argument after 'echo'
+            return _PROVIDER_OK
 
-            # Return a successful result
-            return ProviderExecutionResult(
-                exit_code=0,
-                stdout=b"output",
-                stderr=b"",
-                duration_ms=10
-            )
-
-        executor.provider_executor.execute = mock_execute
+        executor, _ = make_executor(
+            workflow,
+            files={'prompts/loop.md': prompt_content},
+            provider_fake=mock_execute,
+        )
 
         result = executor.execute()
 
@@ -385,62 +312,3 @@ class TestPromptLiteralContents:
             assert '${item}' in prompt
             assert '${loop.index}' in prompt
             assert '${loop.total}' in prompt
-
-    def test_at73_command_step_no_prompt_substitution(self, tmp_path):
-        """Command steps don't have input_file, but verify no regression"""
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
-
-        # Create workflow with command that uses variables
-        workflow = {
-            'version': '1.1',
-            'context': {
-                'name': 'test-value'
-            },
-            'steps': [
-                {
-                    'name': 'CommandStep',
-                    'command': ['echo', '${context.name}'],  # Variables in command ARE substituted
-                    'output_capture': 'text'
-                }
-            ]
-        }
-
-        # Save workflow to file
-        workflow_path = workspace / 'workflow.yaml'
-        with open(workflow_path, 'w') as f:
-            json.dump(workflow, f)
-
-        # Create executor
-        state_manager = StateManager(
-            workspace=workspace,
-            run_id='test-run'
-        )
-        state_manager.initialize('workflow.yaml', {'name': 'test-value'})
-
-        executor = WorkflowExecutor(
-            workflow=load_workflow_bundle_for_test(workspace, workflow_path),
-            workspace=workspace,
-            state_manager=state_manager,
-            debug=False,
-            provider_observation_enabled=False,
-        )
-
-        # Mock subprocess.run
-        captured_command = []
-        def mock_run(cmd, **kwargs):
-            captured_command.clear()
-            captured_command.extend(cmd)
-            result = MagicMock()
-            result.returncode = 0
-            result.stdout = b"output"
-            result.stderr = b""
-            return result
-
-        with patch('subprocess.run', side_effect=mock_run):
-            result = executor.execute()
-
-        assert result['status'] == 'completed'
-
-        # Variables in commands ARE still substituted (this is NOT input_file content)
-        assert captured_command == ['echo', 'test-value']
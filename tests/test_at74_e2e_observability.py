@@ -4,7 +4,6 @@ This test validates that E2E tests display agent I/O when ORCHESTRATE_E2E_VERBOS
 """
 
 import os
-import sys
 from io import StringIO
 from pathlib import Path
 from unittest.mock import patch
@@ -12,6 +11,14 @@ from unittest.mock import patch
 import pytest
 
 
+@pytest.fixture(scope="module")
+def reporter():
+    """Enabled reporter shared by the output tests; it holds no per-call state."""
+    from tests.e2e.reporter import E2ETestReporter
+
+    return E2ETestReporter(enabled=True)
+
+
 def test_at74_e2e_reporter_disabled_by_default():
     """AT-74: Reporter should be disabled by default."""
     from tests.e2e.reporter import E2ETestReporter
@@ -39,12 +46,8 @@ def test_at74_e2e_reporter_enabled_with_env_var():
         assert reporter.enabled
 
 
-def test_at74_e2e_reporter_section_output():
+def test_at74_e2e_reporter_section_output(reporter):
     """AT-74: Reporter should display clear section headers."""
-    from tests.e2e.reporter import E2ETestReporter
-
-    reporter = E2ETestReporter(enabled=True)
-
     with patch('sys.stdout', new=StringIO()) as fake_out:
         reporter.section("Test Section")
         output = fake_out.getvalue()
@@ -52,12 +55,8 @@ def test_at74_e2e_reporter_section_output():
         assert "Test Section" in output
 
 
-def test_at74_e2e_reporter_subsection_output():
+def test_at74_e2e_reporter_subsection_output(reporter):
     """AT-74: Reporter should display subsection headers."""
-    from tests.e2e.reporter import E2ETestReporter
-
-    reporter = E2ETestReporter(enabled=True)
-
     with patch('sys.stdout', new=StringIO()) as fake_out:
         reporter.subsection("Test Subsection")
         output = fake_out.getvalue()
@@ -65,12 +64,8 @@ def test_at74_e2e_reporter_subsection_output():
         assert "Test Subsection" in output
 
 
-def test_at74_e2e_reporter_command_display():
+def test_at74_e2e_reporter_command_display(reporter):
     """AT-74: Reporter should display commands being executed."""
-    from tests.e2e.reporter import E2ETestReporter
-
-    reporter = E2ETestReporter(enabled=True)
-
     with patch('sys.stdout', new=StringIO()) as fake_out:
         reporter.command(["python", "orchestrate", "run", "test.yaml"], cwd="/tmp/workspace")
         output = fake_out.getvalue()
@@ -79,35 +74,22 @@ def test_at74_e2e_reporter_command_display():
         assert "Working dir: /tmp/workspace" in output
 
 
-def test_at74_e2e_reporter_prompt_display():
+def test_at74_e2e_reporter_prompt_display(reporter, tmp_path):
     """AT-74: Reporter should display prompt content."""
-    from tests.e2e.reporter import E2ETestReporter
-    import tempfile
+    prompt_file = tmp_path / "prompt.md"
+    prompt_file.write_text("Test prompt content\nLine 2")
 
-    reporter = E2ETestReporter(enabled=True)
-
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-        f.write("Test prompt content\nLine 2")
-        prompt_file = Path(f.name)
-
-    try:
-        with patch('sys.stdout', new=StringIO()) as fake_out:
-            reporter.prompt(prompt_file)
-            output = fake_out.getvalue()
-            assert "Agent Input (Prompt)" in output
-            assert f"File: {prompt_file}" in output
-            assert "Test prompt content" in output
-            assert "Line 2" in output
-    finally:
-        prompt_file.unlink()
+    with patch('sys.stdout', new=StringIO()) as fake_out:
+        reporter.prompt(prompt_file)
+        output = fake_out.getvalue()
+        assert "Agent Input (Prompt)" in output
+        assert f"File: {prompt_file}" in output
+        assert "Test prompt content" in output
+        assert "Line 2" in output
 
 
-def test_at74_e2e_reporter_agent_output_truncation():
+def test_at74_e2e_reporter_agent_output_truncation(reporter):
     """AT-74: Reporter should truncate long agent output."""
-    from tests.e2e.reporter import E2ETestReporter
-
-    reporter = E2ETestReporter(enabled=True)
-
     # Create long output
     lines = [f"Line {i}" for i in range(100)]
     long_output = "\n".join(lines)
@@ -121,12 +103,8 @@ def test_at74_e2e_reporter_agent_output_truncation():
         assert "lines omitted" in output  # Truncation message
 
 
-def test_at74_e2e_reporter_state_update():
+def test_at74_e2e_reporter_state_update(reporter):
     """AT-74: Reporter should display state updates."""
-    from tests.e2e.reporter import E2ETestReporter
-
-    reporter = E2ETestReporter(enabled=True)
-
     state = {
         "steps": {
             "TestStep": {
@@ -144,13 +122,9 @@ def test_at74_e2e_reporter_state_update():
         assert "Output length: 11 chars" in output
 
 
-def test_at74_e2e_reporter_artifacts_display():
+def test_at74_e2e_reporter_artifacts_display(reporter):
     """AT-74: Reporter should display created artifacts."""
-    from tests.e2e.reporter import E2ETestReporter
     import tempfile
-    import glob
-
-    reporter = E2ETestReporter(enabled=True)
 
     with tempfile.TemporaryDirectory() as tmpdir:
         workspace = Path(tmpdir)
@@ -2,7 +2,6 @@
 
 import json
 import os
-import shutil
 import tempfile
 import zipfile
 from argparse import Namespace
@@ -30,6 +29,16 @@ DEFAULT_WORKFLOW_MAPPING = {
 }
 
 
+# Seeded into every TestCLISafety workspace. Fresh runs require an .orc path;
+# run_workflow's frontend build is mocked in the tests below, so the
+# placeholder is never compiled.
+WORKSPACE_FILES = (
+    ('workflow.orc', b"(workflow-lisp)\n"),
+    ('processed/task1.txt', b'task 1'),
+    ('processed/subdir/task2.txt', b'task 2'),
+)
+
+
 def _state_manager_mock(workspace: Path) -> MagicMock:
     prototype = StateManager(workspace=workspace)
     manager = MagicMock(spec=prototype)
@@ -90,33 +99,21 @@ class TestCLISafety(TestCase):
 
     def setUp(self):
         """Set up test environment."""
-        self.test_dir = Path(tempfile.mkdtemp())
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.test_dir = Path(tmp.name)
         self.workspace = self.test_dir / 'workspace'
-        self.workspace.mkdir()
-
-        # Fresh runs require an .orc path; run_workflow's frontend build is
-        # mocked in the tests below, so this placeholder is never compiled.
         self.workflow_file = self.workspace / 'workflow.orc'
-        self.workflow_file.write_text("(workflow-lisp)\n")
-
-        # Create processed directory
         self.processed_dir = self.workspace / 'processed'
-        self.processed_dir.mkdir()
 
-        # Create some files in processed
-        (self.processed_dir / 'task1.txt').write_text('task 1')
-        (self.processed_dir / 'subdir').mkdir()
-        (self.processed_dir / 'subdir' / 'task2.txt').write_text('task 2')
+        os.makedirs(self.processed_dir / 'subdir')
+        for rel_path, content in WORKSPACE_FILES:
+            (self.workspace / rel_path).write_bytes(content)
 
-        # Save original cwd
-        self.original_cwd = Path.cwd()
+        # Save original cwd; cleanups run LIFO, so this is restored before the tree is removed
+        self.addCleanup(os.chdir, Path.cwd())
         os.chdir(self.workspace)
 
-    def tearDown(self):
-        """Clean up test environment."""
-        os.chdir(self.original_cwd)
-        shutil.rmtree(self.test_dir)
-
     def _stub_frontend_build(self, mock_build, mapping=None) -> SimpleNamespace:
         """Stand in for build_frontend_bundle with a fixture-loaded bundle."""
         bundle = WorkflowLoader(self.workspace).load_mapping(mapping or DEFAULT_WORKFLOW_MAPPING)
@@ -129,15 +126,18 @@ class TestCLISafety(TestCase):
     def test_at11_clean_processed_empties_directory(self):
         """AT-11: Clean processed empties directory."""
         # Verify files exist
-        self.assertTrue((self.processed_dir / 'task1.txt').exists())
-        self.assertTrue((self.processed_dir / 'subdir' / 'task2.txt').exists())
+        with os.scandir(self.processed_dir) as entries:
+            names = {entry.name for entry in entries}
+        self.assertEqual(names, {'task1.txt', 'subdir'})
+        with os.scandir(self.processed_dir / 'subdir') as entries:
+            self.assertEqual({entry.name for entry in entries}, {'task2.txt'})
 
         # Clean directory
         clean_processed_directory(self.processed_dir)
 
-        # Directory should exist but be empty
-        self.assertTrue(self.processed_dir.exists())
-        self.assertEqual(list(self.processed_dir.iterdir()), [])
+        # Directory should exist but be empty (scandir raises if it was removed)
+        with os.scandir(self.processed_dir) as entries:
+            self.assertEqual(list(entries), [])
 
     def test_at11_clean_processed_handles_missing_directory(self):
         """AT-11: Clean processed handles missing directory gracefully."""
@@ -159,13 +159,13 @@ class TestCLISafety(TestCase):
 
         # Verify archive contents
         with zipfile.ZipFile(archive_dest, 'r') as zf:
-            names = zf.namelist()
-            self.assertIn('processed/task1.txt', names)
-            self.assertIn('processed/subdir/task2.txt', names)
+            infos = {info.filename: info for info in zf.infolist()}
+            self.assertIn('processed/task1.txt', infos)
+            self.assertIn('processed/subdir/task2.txt', infos)
+            self.assertEqual(infos['processed/task1.txt'].compress_type, zipfile.ZIP_DEFLATED)
 
             # Verify file content
-            with zf.open('processed/task1.txt') as f:
-                self.assertEqual(f.read().decode(), 'task 1')
+            self.assertEqual(zf.read('processed/task1.txt'), b'task 1')
 
     def test_at12_archive_processed_handles_empty_directory(self):
         """AT-12: Archive processed handles empty directory."""
@@ -179,7 +179,7 @@ class TestCLISafety(TestCase):
         self.assertTrue(archive_dest.exists())
 
         with zipfile.ZipFile(archive_dest, 'r') as zf:
-            self.assertEqual(len(zf.namelist()), 0)
+            self.assertEqual(zf.infolist(), [])
 
     def test_at16_clean_processed_fails_outside_workspace(self):
         """AT-16: CLI Safety - clean fails if processed dir is outside WORKSPACE."""
@@ -232,9 +232,7 @@ class TestCLISafety(TestCase):
 
     def test_parse_context_from_args(self):
         """Parse context from KEY=VALUE arguments."""
-        args = MagicMock()
-        args.context = ['key1=value1', 'key2=value2', 'key3=has=equals']
-        args.context_file = None
+        args = Namespace(context=['key1=value1', 'key2=value2', 'key3=has=equals'], context_file=None)
 
         context = parse_context(args)
 
@@ -253,9 +251,7 @@ class TestCLISafety(TestCase):
             'key3': True  # Should be converted to string
         }))
 
-        args = MagicMock()
-        args.context = None
-        args.context_file = str(context_file)
+        args = Namespace(context=None, context_file=str(context_file))
 
         context = parse_context(args)
 
@@ -272,9 +268,7 @@ class TestCLISafety(TestCase):
             'file_key': 'file_value'
         }))
 
-        args = MagicMock()
-        args.context = ['arg_key=arg_value']
-        args.context_file = str(context_file)
+        args = Namespace(context=['arg_key=arg_value'], context_file=str(context_file))
 
         context = parse_context(args)
 
@@ -285,9 +279,7 @@ class TestCLISafety(TestCase):
 
     def test_parse_context_merges_workflow_defaults(self):
         """Workflow context defaults should be present without CLI inputs."""
-        args = MagicMock()
-        args.context = None
-        args.context_file = None
+        args = Namespace(context=None, context_file=None)
 
         context = parse_context(args, workflow_context={
             'max_review_cycles': 3,
@@ -306,9 +298,7 @@ class TestCLISafety(TestCase):
             'stage': 'C'
         }))
 
-        args = MagicMock()
-        args.context = ['max_review_cycles=5']
-        args.context_file = str(context_file)
+        args = Namespace(context=['max_review_cycles=5'], context_file=str(context_file))
 
         context = parse_context(args, workflow_context={
             'max_review_cycles': '3',
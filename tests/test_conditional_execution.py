@@ -3,9 +3,8 @@ Test suite for conditional execution (when.equals/exists/not_exists).
 Tests AT-37, AT-46, AT-47.
 """
 
-import json
-import os
-import tempfile
+import subprocess
+import uuid
 from pathlib import Path
 import pytest
 
@@ -15,248 +14,254 @@ from orchestrator.state import StateManager
 from tests.workflow_fixture_loader import WorkflowLoader
 
 
+# Shared by tests that never touch the filesystem; evaluate() keeps no state between calls.
+_PURE_EVALUATOR = ConditionEvaluator(Path("/nonexistent"))
+
+
+@pytest.fixture(scope="module")
+def evaluator_root(tmp_path_factory):
+    """One directory shared by the evaluator tests; each test gets a unique child."""
+    return tmp_path_factory.mktemp("cond")
+
+
+@pytest.fixture
+def workspace(evaluator_root):
+    workspace = evaluator_root / uuid.uuid4().hex
+    workspace.mkdir()
+    return workspace
+
+
 class TestConditionEvaluator:
     """Test the ConditionEvaluator class directly."""
 
     def test_no_condition_always_true(self):
         """No condition means always execute."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            evaluator = ConditionEvaluator(Path(tmpdir))
-            assert evaluator.evaluate(None, {}) is True
+        evaluator = _PURE_EVALUATOR
+        assert evaluator.evaluate(None, {}) is True
 
     def test_at37_equals_condition_true(self):
         """AT-37: when.equals with matching values."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            evaluator = ConditionEvaluator(Path(tmpdir))
-            condition = {
-                'equals': {
-                    'left': 'hello',
-                    'right': 'hello'
-                }
+        evaluator = _PURE_EVALUATOR
+        condition = {
+            'equals': {
+                'left': 'hello',
+                'right': 'hello'
             }
-            assert evaluator.evaluate(condition, {}) is True
+        }
+        assert evaluator.evaluate(condition, {}) is True
 
     def test_at37_equals_condition_false(self):
         """AT-37: when.equals with different values."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            evaluator = ConditionEvaluator(Path(tmpdir))
-            condition = {
-                'equals': {
-                    'left': 'hello',
-                    'right': 'world'
-                }
+        evaluator = _PURE_EVALUATOR
+        condition = {
+            'equals': {
+                'left': 'hello',
+                'right': 'world'
             }
-            assert evaluator.evaluate(condition, {}) is False
+        }
+        assert evaluator.evaluate(condition, {}) is False
 
     def test_at37_equals_with_variables(self):
         """AT-37: when.equals with variable substitution."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            evaluator = ConditionEvaluator(Path(tmpdir))
-            condition = {
-                'equals': {
-                    'left': '${context.env}',
-                    'right': 'production'
-                }
+        evaluator = _PURE_EVALUATOR
+        condition = {
+            'equals': {
+                'left': '${context.env}',
+                'right': 'production'
             }
-            variables = {
-                'context': {'env': 'production'}
-            }
-            assert evaluator.evaluate(condition, variables) is True
+        }
+        variables = {
+            'context': {'env': 'production'}
+        }
+        assert evaluator.evaluate(condition, variables) is True
 
-            # Different value
-            variables['context']['env'] = 'development'
-            assert evaluator.evaluate(condition, variables) is False
+        # Different value
+        variables['context']['env'] = 'development'
+        assert evaluator.evaluate(condition, variables) is False
 
-    def test_at46_exists_condition_true(self):
+    def test_at37_equals_unescapes_dollar_literals(self):
+        """AT-37: '$$' escapes still collapse even when no ${...} reference is present."""
+        condition = {'equals': {'left': 'cost: $$5', 'right': 'cost: $5'}}
+        assert _PURE_EVALUATOR.evaluate(condition, {}) is True
+
+    def test_at46_exists_condition_true(self, workspace):
         """AT-46: when.exists true when files match."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-            evaluator = ConditionEvaluator(workspace)
+        evaluator = ConditionEvaluator(workspace)
 
-            # Create test files
-            (workspace / 'test.txt').write_text('hello')
-            (workspace / 'data.json').write_text('{}')
+        # Create test files
+        (workspace / 'test.txt').write_text('hello')
+        (workspace / 'data.json').write_text('{}')
 
-            # Single file exists
-            condition = {'exists': 'test.txt'}
-            assert evaluator.evaluate(condition, {}) is True
+        # Single file exists
+        condition = {'exists': 'test.txt'}
+        assert evaluator.evaluate(condition, {}) is True
 
-            # Glob pattern matches
-            condition = {'exists': '*.txt'}
-            assert evaluator.evaluate(condition, {}) is True
+        # Glob pattern matches
+        condition = {'exists': '*.txt'}
+        assert evaluator.evaluate(condition, {}) is True
 
-            # Multiple matches
-            condition = {'exists': '*'}
-            assert evaluator.evaluate(condition, {}) is True
+        # Multiple matches
+        condition = {'exists': '*'}
+        assert evaluator.evaluate(condition, {}) is True
 
-    def test_at46_exists_condition_false(self):
+    def test_at46_exists_condition_false(self, workspace):
         """AT-46: when.exists false when no files match."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-            evaluator = ConditionEvaluator(workspace)
+        evaluator = ConditionEvaluator(workspace)
 
-            # No files exist
-            condition = {'exists': 'missing.txt'}
-            assert evaluator.evaluate(condition, {}) is False
+        # No files exist
+        condition = {'exists': 'missing.txt'}
+        assert evaluator.evaluate(condition, {}) is False
 
-            # No matches for glob
-            condition = {'exists': '*.py'}
-            assert evaluator.evaluate(condition, {}) is False
+        # No matches for glob
+        condition = {'exists': '*.py'}
+        assert evaluator.evaluate(condition, {}) is False
 
-    def test_at47_not_exists_condition_true(self):
+    def test_at47_not_exists_condition_true(self, workspace):
         """AT-47: when.not_exists true when no files match."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-            evaluator = ConditionEvaluator(workspace)
+        evaluator = ConditionEvaluator(workspace)
 
-            # File doesn't exist
-            condition = {'not_exists': 'missing.txt'}
-            assert evaluator.evaluate(condition, {}) is True
+        # File doesn't exist
+        condition = {'not_exists': 'missing.txt'}
+        assert evaluator.evaluate(condition, {}) is True
 
-            # Create a file
-            (workspace / 'test.txt').write_text('hello')
+        # Create a file
+        (workspace / 'test.txt').write_text('hello')
 
-            # Different file still doesn't exist
-            condition = {'not_exists': 'other.txt'}
-            assert evaluator.evaluate(condition, {}) is True
+        # Different file still doesn't exist
+        condition = {'not_exists': 'other.txt'}
+        assert evaluator.evaluate(condition, {}) is True
 
-            # No .py files
-            condition = {'not_exists': '*.py'}
-            assert evaluator.evaluate(condition, {}) is True
+        # No .py files
+        condition = {'not_exists': '*.py'}
+        assert evaluator.evaluate(condition, {}) is True
 
-    def test_at47_not_exists_condition_false(self):
+    def test_at47_not_exists_condition_false(self, workspace):
         """AT-47: when.not_exists false when files match."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-            evaluator = ConditionEvaluator(workspace)
+        evaluator = ConditionEvaluator(workspace)
 
-            # Create test file
-            (workspace / 'test.txt').write_text('hello')
+        # Create test file
+        (workspace / 'test.txt').write_text('hello')
 
-            # File exists
-            condition = {'not_exists': 'test.txt'}
-            assert evaluator.evaluate(condition, {}) is False
+        # File exists
+        condition = {'not_exists': 'test.txt'}
+        assert evaluator.evaluate(condition, {}) is False
 
-            # Glob matches
-            condition = {'not_exists': '*.txt'}
-            assert evaluator.evaluate(condition, {}) is False
+        # Glob matches
+        condition = {'not_exists': '*.txt'}
+        assert evaluator.evaluate(condition, {}) is False
 
-    def test_exists_with_directories(self):
+    def test_exists_with_directories(self, workspace):
         """when.exists should work with directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-            evaluator = ConditionEvaluator(workspace)
+        evaluator = ConditionEvaluator(workspace)
+
+        # Create directory
+        (workspace / 'mydir').mkdir()
+
+        condition = {'exists': 'mydir'}
+        assert evaluator.evaluate(condition, {}) is True
 
-            # Create directory
-            (workspace / 'mydir').mkdir()
+        condition = {'not_exists': 'mydir'}
+        assert evaluator.evaluate(condition, {}) is False
 
-            condition = {'exists': 'mydir'}
-            assert evaluator.evaluate(condition, {}) is True
+    def test_exists_wildcard_skips_hidden_files(self, workspace):
+        """Top-level wildcards follow glob: dot-files need a leading '.' in the pattern."""
+        evaluator = ConditionEvaluator(workspace)
+        (workspace / '.state.lock').write_text('')
+        (workspace / 'nested').mkdir()
+        (workspace / 'nested' / 'report.md').write_text('')
 
-            condition = {'not_exists': 'mydir'}
-            assert evaluator.evaluate(condition, {}) is False
+        assert evaluator.evaluate({'exists': '*.lock'}, {}) is False
+        assert evaluator.evaluate({'exists': '.*.lock'}, {}) is True
+        assert evaluator.evaluate({'exists': '*.md'}, {}) is False
+        assert evaluator.evaluate({'exists': '*/*.md'}, {}) is True
 
-    def test_path_safety_in_conditions(self):
+    def test_path_safety_in_conditions(self, workspace):
         """Conditions should reject unsafe paths."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-            evaluator = ConditionEvaluator(workspace)
+        evaluator = ConditionEvaluator(workspace)
 
-            # Absolute path should be rejected
-            condition = {'exists': '/etc/passwd'}
-            with pytest.raises(ValueError, match="Unsafe path"):
-                evaluator.evaluate(condition, {})
+        # Absolute path should be rejected
+        condition = {'exists': '/etc/passwd'}
+        with pytest.raises(ValueError, match="Unsafe path"):
+            evaluator.evaluate(condition, {})
 
-            # Parent traversal should be rejected
-            condition = {'exists': '../etc/passwd'}
-            with pytest.raises(ValueError, match="Unsafe path"):
-                evaluator.evaluate(condition, {})
+        # Parent traversal should be rejected
+        condition = {'exists': '../etc/passwd'}
+        with pytest.raises(ValueError, match="Unsafe path"):
+            evaluator.evaluate(condition, {})
 
     def test_invalid_condition_format(self):
         """Invalid condition formats should raise errors."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            evaluator = ConditionEvaluator(Path(tmpdir))
+        evaluator = _PURE_EVALUATOR
 
-            # No condition type
-            with pytest.raises(ValueError, match="No valid condition type"):
-                evaluator.evaluate({}, {})
+        # No condition type
+        with pytest.raises(ValueError, match="No valid condition type"):
+            evaluator.evaluate({}, {})
 
-            # Multiple condition types
-            with pytest.raises(ValueError, match="Multiple condition types"):
-                evaluator.evaluate({'equals': {}, 'exists': 'file'}, {})
+        # Multiple condition types
+        with pytest.raises(ValueError, match="Multiple condition types"):
+            evaluator.evaluate({'equals': {}, 'exists': 'file'}, {})
 
-            # Invalid equals format
-            with pytest.raises(ValueError, match="must have 'left' and 'right'"):
-                evaluator.evaluate({'equals': {'left': 'val'}}, {})
+        # Invalid equals format
+        with pytest.raises(ValueError, match="must have 'left' and 'right'"):
+            evaluator.evaluate({'equals': {'left': 'val'}}, {})
 
     def test_type_coercion_in_equals(self):
         """Values should be coerced to strings for comparison."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            evaluator = ConditionEvaluator(Path(tmpdir))
-
-            # Number to string
-            condition = {
-                'equals': {
-                    'left': '${steps.count.exit_code}',
-                    'right': '0'
-                }
-            }
-            variables = {
-                'steps': {'count': {'exit_code': 0}}
-            }
-            assert evaluator.evaluate(condition, variables) is True
+        evaluator = _PURE_EVALUATOR
 
-            # Boolean to string
-            condition = {
-                'equals': {
-                    'left': '${context.enabled}',
-                    'right': 'true'
-                }
+        # Number to string
+        condition = {
+            'equals': {
+                'left': '${steps.count.exit_code}',
+                'right': '0'
             }
-            variables = {
-                'context': {'enabled': True}
+        }
+        variables = {
+            'steps': {'count': {'exit_code': 0}}
+        }
+        assert evaluator.evaluate(condition, variables) is True
+
+        # Boolean to string
+        condition = {
+            'equals': {
+                'left': '${context.enabled}',
+                'right': 'true'
             }
-            assert evaluator.evaluate(condition, variables) is True
+        }
+        variables = {
+            'context': {'enabled': True}
+        }
+        assert evaluator.evaluate(condition, variables) is True
 
     def test_v16_gate_compare_condition_true(self):
         """v1.6 typed gate predicates can compare structured refs to literals."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            evaluator = ConditionEvaluator(Path(tmpdir))
-            condition = {
-                'compare': {
-                    'left': {'ref': 'root.steps.Score.artifacts.total'},
-                    'op': 'gte',
-                    'right': 5,
-                }
+        evaluator = _PURE_EVALUATOR
+        condition = {
+            'compare': {
+                'left': {'ref': 'root.steps.Score.artifacts.total'},
+                'op': 'gte',
+                'right': 5,
             }
-            state = {
-                'steps': {
-                    'Score': {
+        }
+        state = {
+            'steps': {
+                'Score': {
+                    'status': 'completed',
+                    'exit_code': 0,
+                    'artifacts': {'total': 7},
+                    'outcome': {
                         'status': 'completed',
-                        'exit_code': 0,
-                        'artifacts': {'total': 7},
-                        'outcome': {
-                            'status': 'completed',
-                            'phase': 'execution',
-                            'class': 'completed',
-                            'retryable': False,
-                        },
-                    }
+                        'phase': 'execution',
+                        'class': 'completed',
+                        'retryable': False,
+                    },
                 }
             }
-            assert evaluator.evaluate(condition, {}, state) is True
-
-
-class TestWorkflowConditionalExecution:
-    """Test conditional execution within workflows."""
+        }
+        assert evaluator.evaluate(condition, {}, state) is True
 
-    def test_at37_conditional_skip_when_false(self):
-        """AT-37: False when condition -> step skipped with exit_code 0."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
 
-            # Create workflow with conditional step
-            workflow_yaml = r"""
+CONDITIONAL_SKIP_WORKFLOW = r"""
 {
   "version": "1.1",
   "name": "Conditional Test",
@@ -277,42 +282,8 @@ class TestWorkflowConditionalExecution:
   ]
 }
 """
-            workflow_file = workspace / 'workflow.yaml'
-            workflow_file.write_text(workflow_yaml)
-
-            # Load and execute workflow
-            loader = WorkflowLoader(workspace)
-            workflow = loader.load(str(workflow_file))
-
-            state_dir = workspace / '.orchestrate' / 'test_run'
-            state_dir.mkdir(parents=True)
-            state_manager = StateManager(state_dir)
-            state_manager.initialize(str(workflow_file))
-
-            executor = WorkflowExecutor(
-                workflow=workflow,
-                workspace=workspace,
-                state_manager=state_manager
-            )
-
-            # Execute
-            state = executor.execute()
-
-            # Verify step was skipped
-            assert 'steps' in state
-            assert 'ConditionalStep' in state['steps']
-            step_result = state['steps']['ConditionalStep']
-            assert step_result['status'] == 'skipped'
-            assert step_result['exit_code'] == 0
-            assert step_result.get('skipped') is True
-
-    def test_at37_conditional_execute_when_true(self):
-        """AT-37: True when condition -> step executes normally."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
 
-            # Create workflow with conditional step
-            workflow_yaml = r"""
+CONDITIONAL_EXECUTE_WORKFLOW = r"""
 {
   "version": "1.1",
   "name": "Conditional Test",
@@ -333,45 +304,8 @@ class TestWorkflowConditionalExecution:
   ]
 }
 """
-            workflow_file = workspace / 'workflow.yaml'
-            workflow_file.write_text(workflow_yaml)
-
-            # Load and execute workflow
-            loader = WorkflowLoader(workspace)
-            workflow = loader.load(str(workflow_file))
-
-            state_dir = workspace / '.orchestrate' / 'test_run'
-            state_dir.mkdir(parents=True)
-            state_manager = StateManager(state_dir)
-            state_manager.initialize(str(workflow_file))
-
-            executor = WorkflowExecutor(
-                workflow=workflow,
-                workspace=workspace,
-                state_manager=state_manager
-            )
-
-            # Execute
-            state = executor.execute()
-
-            # Verify step executed
-            assert 'steps' in state
-            assert 'ConditionalStep' in state['steps']
-            step_result = state['steps']['ConditionalStep']
-            assert step_result['exit_code'] == 0
-            assert step_result.get('skipped') is not True
-            assert 'output' in step_result  # Command was executed
 
-    def test_at46_when_exists_in_workflow(self):
-        """AT-46: when.exists condition in workflow."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-
-            # Create a test file
-            (workspace / 'data.txt').write_text('test data')
-
-            # Create workflow with exists condition
-            workflow_yaml = r"""
+EXISTS_WORKFLOW = r"""
 {
   "version": "1.1",
   "name": "Exists Test",
@@ -399,46 +333,8 @@ class TestWorkflowConditionalExecution:
   ]
 }
 """
-            workflow_file = workspace / 'workflow.yaml'
-            workflow_file.write_text(workflow_yaml)
-
-            # Load and execute workflow
-            loader = WorkflowLoader(workspace)
-            workflow = loader.load(str(workflow_file))
-
-            state_dir = workspace / '.orchestrate' / 'test_run'
-            state_dir.mkdir(parents=True)
-            state_manager = StateManager(state_dir)
-            state_manager.initialize(str(workflow_file))
-
-            executor = WorkflowExecutor(
-                workflow=workflow,
-                workspace=workspace,
-                state_manager=state_manager
-            )
-
-            # Execute
-            state = executor.execute()
-
-            # First step should execute
-            assert state['steps']['CheckExists']['exit_code'] == 0
-            assert 'output' in state['steps']['CheckExists']
-
-            # Second step should be skipped
-            assert state['steps']['CheckMissing']['status'] == 'skipped'
-            assert state['steps']['CheckMissing']['exit_code'] == 0
-            assert state['steps']['CheckMissing'].get('skipped') is True
-
-    def test_at47_when_not_exists_in_workflow(self):
-        """AT-47: when.not_exists condition in workflow."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-
-            # Create a test file
-            (workspace / 'existing.txt').write_text('test data')
-
-            # Create workflow with not_exists condition
-            workflow_yaml = r"""
+
+NOT_EXISTS_WORKFLOW = r"""
 {
   "version": "1.1",
   "name": "Not Exists Test",
@@ -466,43 +362,8 @@ class TestWorkflowConditionalExecution:
   ]
 }
 """
-            workflow_file = workspace / 'workflow.yaml'
-            workflow_file.write_text(workflow_yaml)
-
-            # Load and execute workflow
-            loader = WorkflowLoader(workspace)
-            workflow = loader.load(str(workflow_file))
-
-            state_dir = workspace / '.orchestrate' / 'test_run'
-            state_dir.mkdir(parents=True)
-            state_manager = StateManager(state_dir)
-            state_manager.initialize(str(workflow_file))
 
-            executor = WorkflowExecutor(
-                workflow=workflow,
-                workspace=workspace,
-                state_manager=state_manager
-            )
-
-            # Execute
-            state = executor.execute()
-
-            # First step should execute (no .lock files)
-            assert state['steps']['CheckNotExists']['exit_code'] == 0
-            assert 'output' in state['steps']['CheckNotExists']
-
-            # Second step should be skipped (file exists)
-            assert state['steps']['CheckExists']['status'] == 'skipped'
-            assert state['steps']['CheckExists']['exit_code'] == 0
-            assert state['steps']['CheckExists'].get('skipped') is True
-
-    def test_condition_with_variables_in_workflow(self):
-        """Conditions should support variable substitution in workflows."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-
-            # Create workflow with variable-based condition
-            workflow_yaml = r"""
+VARIABLE_CONDITION_WORKFLOW = r"""
 {
   "version": "1.1",
   "name": "Variable Condition Test",
@@ -547,45 +408,8 @@ class TestWorkflowConditionalExecution:
   ]
 }
 """
-            workflow_file = workspace / 'workflow.yaml'
-            workflow_file.write_text(workflow_yaml)
-
-            # Load and execute workflow
-            loader = WorkflowLoader(workspace)
-            workflow = loader.load(str(workflow_file))
-
-            state_dir = workspace / '.orchestrate' / 'test_run'
-            state_dir.mkdir(parents=True)
-            state_manager = StateManager(state_dir)
-            state_manager.initialize(str(workflow_file))
-
-            executor = WorkflowExecutor(
-                workflow=workflow,
-                workspace=workspace,
-                state_manager=state_manager
-            )
-
-            # Execute
-            state = executor.execute()
-
-            # Init step always runs
-            assert state['steps']['InitStep']['exit_code'] == 0
 
-            # Conditional step should run (env = production)
-            assert state['steps']['ConditionalStep']['exit_code'] == 0
-            assert 'output' in state['steps']['ConditionalStep']
-
-            # Skip step should be skipped (env != development)
-            assert state['steps']['SkipStep']['status'] == 'skipped'
-            assert state['steps']['SkipStep']['exit_code'] == 0
-
-    def test_condition_in_for_each_loop(self):
-        """Conditions should work within for-each loops."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-
-            # Create workflow with conditional steps in loop
-            workflow_yaml = r"""
+LOOP_CONDITION_WORKFLOW = r"""
 {
   "version": "1.1",
   "name": "Loop Condition Test",
@@ -619,40 +443,122 @@ class TestWorkflowConditionalExecution:
   ]
 }
 """
-            workflow_file = workspace / 'workflow.yaml'
-            workflow_file.write_text(workflow_yaml)
-
-            # Load and execute workflow
-            loader = WorkflowLoader(workspace)
-            workflow = loader.load(str(workflow_file))
-
-            state_dir = workspace / '.orchestrate' / 'test_run'
-            state_dir.mkdir(parents=True)
-            state_manager = StateManager(state_dir)
-            state_manager.initialize(str(workflow_file))
-
-            executor = WorkflowExecutor(
-                workflow=workflow,
-                workspace=workspace,
-                state_manager=state_manager
-            )
-
-            # Execute
-            state = executor.execute()
-
-            # Check loop results
-            assert 'steps' in state
-            assert 'ProcessItems' in state['steps']
-            loop_results = state['steps']['ProcessItems']
-            assert isinstance(loop_results, list)
-            assert len(loop_results) == 4
-
-            # Items 0 and 2 should be skipped (item = "skip")
-            assert loop_results[0]['ConditionalProcess']['status'] == 'skipped'
-            assert loop_results[2]['ConditionalProcess']['status'] == 'skipped'
-
-            # Items 1 and 3 should execute (item = "process")
-            assert loop_results[1]['ConditionalProcess']['exit_code'] == 0
-            assert 'output' in loop_results[1]['ConditionalProcess']
-            assert loop_results[3]['ConditionalProcess']['exit_code'] == 0
-            assert 'output' in loop_results[3]['ConditionalProcess']
+
+
+def _run_workflow(workspace, workflow_yaml, files=None):
+    """Write, load, and execute a workflow in workspace; return the final state."""
+    for rel_path, content in (files or {}).items():
+        (workspace / rel_path).write_text(content)
+
+    workflow_file = workspace / 'workflow.yaml'
+    workflow_file.write_bytes(workflow_yaml.encode())
+
+    loader = WorkflowLoader(workspace)
+    workflow = loader.load(str(workflow_file))
+
+    state_dir = workspace / '.orchestrate' / 'test_run'
+    state_dir.mkdir(parents=True)
+    state_manager = StateManager(state_dir)
+    state_manager.initialize(str(workflow_file))
+
+    executor = WorkflowExecutor(
+        workflow=workflow,
+        workspace=workspace,
+        state_manager=state_manager
+    )
+    return executor.execute()
+
+
+class TestWorkflowConditionalExecution:
+    """Test conditional execution within workflows."""
+
+    @pytest.fixture(autouse=True)
+    def _inprocess_echo(self, monkeypatch):
+        """Answer `echo` command steps in-process; these tests only need a successful step."""
+        real_run = subprocess.run
+
+        def _run(argv, **kwargs):
+            if argv and argv[0] == 'echo':
+                stdout = (' '.join(argv[1:]) + '\n').encode('utf-8')
+                return subprocess.CompletedProcess(argv, 0, stdout, b'')
+            return real_run(argv, **kwargs)
+
+        monkeypatch.setattr(subprocess, 'run', _run)
+
+    @pytest.mark.parametrize(
+        "workflow_yaml,should_run",
+        [(CONDITIONAL_SKIP_WORKFLOW, False), (CONDITIONAL_EXECUTE_WORKFLOW, True)],
+        ids=["skip_when_false", "execute_when_true"],
+    )
+    def test_at37_conditional_step(self, tmp_path, workflow_yaml, should_run):
+        """AT-37: False when condition -> step skipped with exit_code 0; true -> step executes normally."""
+        state = _run_workflow(tmp_path, workflow_yaml)
+
+        assert 'steps' in state
+        assert 'ConditionalStep' in state['steps']
+        step_result = state['steps']['ConditionalStep']
+        assert step_result['exit_code'] == 0
+        if should_run:
+            assert step_result.get('skipped') is not True
+            assert 'output' in step_result  # Command was executed
+        else:
+            assert step_result['status'] == 'skipped'
+            assert step_result.get('skipped') is True
+
+    @pytest.mark.parametrize(
+        "existing_file,workflow_yaml,ran_step,skipped_step",
+        [
+            pytest.param('data.txt', EXISTS_WORKFLOW, 'CheckExists', 'CheckMissing', id="at46_exists"),
+            pytest.param('existing.txt', NOT_EXISTS_WORKFLOW, 'CheckNotExists', 'CheckExists', id="at47_not_exists"),
+        ],
+    )
+    def test_at46_at47_file_conditions_in_workflow(
+        self, tmp_path, existing_file, workflow_yaml, ran_step, skipped_step
+    ):
+        """AT-46/AT-47: when.exists / when.not_exists conditions in workflow."""
+        state = _run_workflow(tmp_path, workflow_yaml, files={existing_file: 'test data'})
+
+        # Matching step executes
+        assert state['steps'][ran_step]['exit_code'] == 0
+        assert 'output' in state['steps'][ran_step]
+
+        # Other step is skipped
+        assert state['steps'][skipped_step]['status'] == 'skipped'
+        assert state['steps'][skipped_step]['exit_code'] == 0
+        assert state['steps'][skipped_step].get('skipped') is True
+
+    def test_condition_with_variables_in_workflow(self, tmp_path):
+        """Conditions should support variable substitution in workflows."""
+        state = _run_workflow(tmp_path, VARIABLE_CONDITION_WORKFLOW)
+
+        # Init step always runs
+        assert state['steps']['InitStep']['exit_code'] == 0
+
+        # Conditional step should run (env = production)
+        assert state['steps']['ConditionalStep']['exit_code'] == 0
+        assert 'output' in state['steps']['ConditionalStep']
+
+        # Skip step should be skipped (env != development)
+        assert state['steps']['SkipStep']['status'] == 'skipped'
+        assert state['steps']['SkipStep']['exit_code'] == 0
+
+    def test_condition_in_for_each_loop(self, tmp_path):
+        """Conditions should work within for-each loops."""
+        state = _run_workflow(tmp_path, LOOP_CONDITION_WORKFLOW)
+
+        # Check loop results
+        assert 'steps' in state
+        assert 'ProcessItems' in state['steps']
+        loop_results = state['steps']['ProcessItems']
+        assert isinstance(loop_results, list)
+        assert len(loop_results) == 4
+
+        processed = [result['ConditionalProcess'] for result in loop_results]
+
+        # Items 0 and 2 should be skipped (item = "skip")
+        assert [processed[0]['status'], processed[2]['status']] == ['skipped', 'skipped']
+
+        # Items 1 and 3 should execute (item = "process")
+        for result in (processed[1], processed[3]):
+            assert result['exit_code'] == 0
+            assert 'output' in result
@@ -1,6 +1,5 @@
 """Tests for dependency injection (AT-28-35)."""
 
-import tempfile
 import pytest
 from pathlib import Path
 
@@ -15,315 +14,338 @@ from orchestrator.deps.content_snapshot import (
 class TestDependencyInjection:
     """Test dependency injection into prompts."""
     
-    def test_at28_basic_injection(self):
+    def test_at28_basic_injection(self, tmp_path):
         """AT-28: Basic injection with inject: true."""
-        with tempfile.TemporaryDirectory() as workspace:
-            injector = DependencyInjector(workspace)
-            
-            prompt = "Please implement this feature."
-            files = ['artifacts/spec.md', 'docs/requirements.txt']
-            inject_config = True  # Shorthand
-            
-            result = injector.inject(prompt, files, inject_config)
-            
-            # Should prepend list of files with default instruction
-            assert "The following required files are available:" in result.modified_prompt
-            assert "- artifacts/spec.md" in result.modified_prompt
-            assert "- docs/requirements.txt" in result.modified_prompt
-            assert "Please implement this feature." in result.modified_prompt
-            assert not result.was_truncated
-            
-    def test_at29_list_mode_injection(self):
+        workspace = str(tmp_path)
+        injector = DependencyInjector(workspace)
+        
+        prompt = "Please implement this feature."
+        files = ['artifacts/spec.md', 'docs/requirements.txt']
+        inject_config = True  # Shorthand
+        
+        result = injector.inject(prompt, files, inject_config)
+        
+        # Should prepend list of files with default instruction
+        assert "The following required files are available:" in result.modified_prompt
+        assert "- artifacts/spec.md" in result.modified_prompt
+        assert "- docs/requirements.txt" in result.modified_prompt
+        assert "Please implement this feature." in result.modified_prompt
+        assert not result.was_truncated
+        
+    def test_at29_list_mode_injection(self, tmp_path):
         """AT-29: List mode injection lists all file paths."""
-        with tempfile.TemporaryDirectory() as workspace:
-            injector = DependencyInjector(workspace)
-            
-            prompt = "Original prompt content."
-            files = ['file1.txt', 'file2.txt', 'dir/file3.txt']
-            inject_config = {
-                'mode': 'list',
-                'position': 'prepend'
-            }
-            
-            result = injector.inject(prompt, files, inject_config)
-            
-            # Check list format
-            lines = result.modified_prompt.split('\n')
-            assert "The following required files are available:" in lines[0]
-            assert "  - file1.txt" in result.modified_prompt
-            assert "  - file2.txt" in result.modified_prompt
-            assert "  - dir/file3.txt" in result.modified_prompt
-            
-    def test_at30_content_mode_injection(self):
+        workspace = str(tmp_path)
+        injector = DependencyInjector(workspace)
+        
+        prompt = "Original prompt content."
+        files = ['file1.txt', 'file2.txt', 'dir/file3.txt']
+        inject_config = {
+            'mode': 'list',
+            'position': 'prepend'
+        }
+        
+        result = injector.inject(prompt, files, inject_config)
+        
+        # Check list format
+        lines = result.modified_prompt.split('\n')
+        assert "The following required files are available:" in lines[0]
+        assert "  - file1.txt" in result.modified_prompt
+        assert "  - file2.txt" in result.modified_prompt
+        assert "  - dir/file3.txt" in result.modified_prompt
+        
+    def test_at30_content_mode_injection(self, tmp_path):
         """AT-30: Content mode includes file contents."""
-        with tempfile.TemporaryDirectory() as workspace:
-            # Create test files with content
-            Path(workspace, 'file1.txt').write_text('Content of file 1')
-            Path(workspace, 'file2.txt').write_text('Content of file 2')
-            
-            injector = DependencyInjector(workspace)
-            
-            prompt = "Process these files."
-            files = ['file1.txt', 'file2.txt']
-            inject_config = {
-                'mode': 'content',
-                'position': 'prepend'
-            }
-            
-            result = injector.inject(prompt, files, inject_config)
-            
-            # Check content format
-            assert "=== File: file1.txt" in result.modified_prompt
-            assert "Content of file 1" in result.modified_prompt
-            assert "=== File: file2.txt" in result.modified_prompt
-            assert "Content of file 2" in result.modified_prompt
-            assert "bytes) ===" in result.modified_prompt  # Size info
-            
-    def test_at31_custom_instruction(self):
+        workspace = str(tmp_path)
+        # Create test files with content
+        Path(workspace, 'file1.txt').write_text('Content of file 1')
+        Path(workspace, 'file2.txt').write_text('Content of file 2')
+        
+        injector = DependencyInjector(workspace)
+        
+        prompt = "Process these files."
+        files = ['file1.txt', 'file2.txt']
+        inject_config = {
+            'mode': 'content',
+            'position': 'prepend'
+        }
+        
+        result = injector.inject(prompt, files, inject_config)
+        
+        # Check content format
+        assert "=== File: file1.txt" in result.modified_prompt
+        assert "Content of file 1" in result.modified_prompt
+        assert "=== File: file2.txt" in result.modified_prompt
+        assert "Content of file 2" in result.modified_prompt
+        assert "bytes) ===" in result.modified_prompt  # Size info
+        
+    def test_at31_custom_instruction(self, tmp_path):
         """AT-31: Custom instruction overrides default."""
-        with tempfile.TemporaryDirectory() as workspace:
-            injector = DependencyInjector(workspace)
-            
-            prompt = "Main prompt."
-            files = ['spec.md']
-            inject_config = {
-                'mode': 'list',
-                'instruction': 'Review these architecture documents:'
-            }
-            
-            result = injector.inject(prompt, files, inject_config)
-            
-            assert "Review these architecture documents:" in result.modified_prompt
-            assert "The following required files" not in result.modified_prompt
-            
-    def test_at32_append_position(self):
+        workspace = str(tmp_path)
+        injector = DependencyInjector(workspace)
+        
+        prompt = "Main prompt."
+        files = ['spec.md']
+        inject_config = {
+            'mode': 'list',
+            'instruction': 'Review these architecture documents:'
+        }
+        
+        result = injector.inject(prompt, files, inject_config)
+        
+        assert "Review these architecture documents:" in result.modified_prompt
+        assert "The following required files" not in result.modified_prompt
+        
+    def test_at32_append_position(self, tmp_path):
         """AT-32: Append position places injection after prompt."""
-        with tempfile.TemporaryDirectory() as workspace:
-            injector = DependencyInjector(workspace)
-            
-            prompt = "First part of prompt."
-            files = ['appended.txt']
-            inject_config = {
-                'mode': 'list',
-                'position': 'append'
-            }
-            
-            result = injector.inject(prompt, files, inject_config)
-            
-            # Prompt should come first, then injection
-            lines = result.modified_prompt.split('\n')
-            assert lines[0] == "First part of prompt."
-            # Injection comes after a blank line
-            assert "The following required files are available:" in result.modified_prompt
-            assert result.modified_prompt.index("First part") < result.modified_prompt.index("following required")
-            
-    def test_at33_pattern_injection(self):
+        workspace = str(tmp_path)
+        injector = DependencyInjector(workspace)
+        
+        prompt = "First part of prompt."
+        files = ['appended.txt']
+        inject_config = {
+            'mode': 'list',
+            'position': 'append'
+        }
+        
+        result = injector.inject(prompt, files, inject_config)
+        
+        # Prompt should come first, then injection
+        lines = result.modified_prompt.split('\n')
+        assert lines[0] == "First part of prompt."
+        # Injection comes after a blank line
+        assert "The following required files are available:" in result.modified_prompt
+        assert result.modified_prompt.index("First part") < result.modified_prompt.index("following required")
+        
+    def test_at33_pattern_injection(self, tmp_path):
         """AT-33: Patterns resolve to full list before injection.
         
         Note: This test validates the injector can handle
         multiple files from glob expansion.
         """
-        with tempfile.TemporaryDirectory() as workspace:
-            injector = DependencyInjector(workspace)
-            
-            # Files that would come from glob expansion
-            files = ['doc1.md', 'doc2.md', 'doc3.md']
-            inject_config = True
-            
-            result = injector.inject("", files, inject_config)
-            
-            # All files should be listed
-            assert "- doc1.md" in result.modified_prompt
-            assert "- doc2.md" in result.modified_prompt
-            assert "- doc3.md" in result.modified_prompt
-            
-    def test_at34_optional_file_injection(self):
+        workspace = str(tmp_path)
+        injector = DependencyInjector(workspace)
+        
+        # Files that would come from glob expansion
+        files = ['doc1.md', 'doc2.md', 'doc3.md']
+        inject_config = True
+        
+        result = injector.inject("", files, inject_config)
+        
+        # All files should be listed
+        assert "- doc1.md" in result.modified_prompt
+        assert "- doc2.md" in result.modified_prompt
+        assert "- doc3.md" in result.modified_prompt
+        
+    def test_at34_optional_file_injection(self, tmp_path):
         """AT-34: Missing optional files are omitted from injection.
         
         Note: The resolver handles filtering, injector just
         processes the files it's given.
         """
-        with tempfile.TemporaryDirectory() as workspace:
-            injector = DependencyInjector(workspace)
-            
-            # Only existing files passed to injector
-            files = ['exists1.txt', 'exists2.txt']
-            inject_config = True
-            
-            result = injector.inject("", files, inject_config, is_required=False)
-            
-            # Should use 'optional' in instruction
-            assert "optional files are available" in result.modified_prompt
-            assert "- exists1.txt" in result.modified_prompt
-            assert "- exists2.txt" in result.modified_prompt
-            
-    def test_at35_no_injection_default(self):
+        workspace = str(tmp_path)
+        injector = DependencyInjector(workspace)
+        
+        # Only existing files passed to injector
+        files = ['exists1.txt', 'exists2.txt']
+        inject_config = True
+        
+        result = injector.inject("", files, inject_config, is_required=False)
+        
+        # Should use 'optional' in instruction
+        assert "optional files are available" in result.modified_prompt
+        assert "- exists1.txt" in result.modified_prompt
+        assert "- exists2.txt" in result.modified_prompt
+        
+    def test_at35_no_injection_default(self, tmp_path):
         """AT-35: Without inject config, prompt is unchanged."""
-        with tempfile.TemporaryDirectory() as workspace:
-            injector = DependencyInjector(workspace)
-            
-            original_prompt = "This is the original prompt content."
-            files = ['file1.txt', 'file2.txt']
-            
-            # No injection config
-            result = injector.inject(original_prompt, files, None)
-            assert result.modified_prompt == original_prompt
-            
-            # inject: false
-            result = injector.inject(original_prompt, files, False)
-            assert result.modified_prompt == original_prompt
-            
-            # mode: none
-            result = injector.inject(original_prompt, files, {'mode': 'none'})
-            assert result.modified_prompt == original_prompt
-            
-    def test_content_mode_truncation(self):
+        workspace = str(tmp_path)
+        injector = DependencyInjector(workspace)
+        
+        original_prompt = "This is the original prompt content."
+        files = ['file1.txt', 'file2.txt']
+        
+        # No injection config
+        result = injector.inject(original_prompt, files, None)
+        assert result.modified_prompt == original_prompt
+        
+        # inject: false
+        result = injector.inject(original_prompt, files, False)
+        assert result.modified_prompt == original_prompt
+        
+        # mode: none
+        result = injector.inject(original_prompt, files, {'mode': 'none'})
+        assert result.modified_prompt == original_prompt
+        
+    def test_content_mode_truncation(self, tmp_path):
         """Content mode truncates at size limit."""
-        with tempfile.TemporaryDirectory() as workspace:
-            # Create large file
-            large_content = "x" * (300 * 1024)  # 300KB
-            Path(workspace, 'large.txt').write_text(large_content)
-            
-            injector = DependencyInjector(workspace)
-            
-            files = ['large.txt']
-            inject_config = {
-                'mode': 'content'
-            }
-            
-            result = injector.inject("", files, inject_config)
-            
-            assert result.was_truncated
-            assert result.truncation_details is not None
-            assert "truncated" in result.modified_prompt
-            assert result.truncation_details['truncation_details']['files_truncated'] == 1
-            
-    def test_list_mode_truncation(self):
+        workspace = str(tmp_path)
+        # Create large file
+        large_content = "x" * (300 * 1024)  # 300KB
+        Path(workspace, 'large.txt').write_text(large_content)
+        
+        injector = DependencyInjector(workspace)
+        
+        files = ['large.txt']
+        inject_config = {
+            'mode': 'content'
+        }
+        
+        result = injector.inject("", files, inject_config)
+        
+        assert result.was_truncated
+        assert result.truncation_details is not None
+        assert "truncated" in result.modified_prompt
+        assert result.truncation_details['truncation_details']['files_truncated'] == 1
+        
+    def test_list_mode_truncation(self, tmp_path):
         """List mode truncates when too many files."""
-        with tempfile.TemporaryDirectory() as workspace:
-            injector = DependencyInjector(workspace)
-            
-            # Create many files with long paths
-            files = [f"very/long/path/to/file/number_{i:04d}/document.txt" for i in range(10000)]
-            inject_config = {'mode': 'list'}
-            
-            result = injector.inject("", files, inject_config)
-            
-            assert result.was_truncated
-            assert "files omitted due to size limit" in result.modified_prompt
-            
-    def test_empty_prompt_injection(self):
+        workspace = str(tmp_path)
+        injector = DependencyInjector(workspace)
+        
+        # Create many files with long paths
+        files = [f"very/long/path/to/file/number_{i:04d}/document.txt" for i in range(10000)]
+        inject_config = {'mode': 'list'}
+        
+        result = injector.inject("", files, inject_config)
+        
+        assert result.was_truncated
+        assert "files omitted due to size limit" in result.modified_prompt
+        
+    def test_empty_prompt_injection(self, tmp_path):
         """Injection works with empty prompt."""
-        with tempfile.TemporaryDirectory() as workspace:
-            injector = DependencyInjector(workspace)
-            
-            files = ['file.txt']
-            inject_config = True
-            
-            result = injector.inject("", files, inject_config)
-            
-            # Should just have the injection content
-            assert "The following required files are available:" in result.modified_prompt
-            assert "- file.txt" in result.modified_prompt
+        workspace = str(tmp_path)
+        injector = DependencyInjector(workspace)
+        
+        files = ['file.txt']
+        inject_config = True
+        
+        result = injector.inject("", files, inject_config)
+        
+        # Should just have the injection content
+        assert "The following required files are available:" in result.modified_prompt
+        assert "- file.txt" in result.modified_prompt
 
-    def test_content_mode_can_consume_an_immutable_snapshot(self):
-        with tempfile.TemporaryDirectory() as workspace:
-            injector = DependencyInjector(workspace)
-            snapshot = build_content_snapshot(
-                (
-                    AuthoredDependencyRow(
-                        role="required",
-                        authored_index=0,
-                        binding_ref="ref",
-                        evaluated_relpath="alias.txt",
-                        canonical_target="canonical.txt",
-                    ),
+    def test_content_mode_can_consume_an_immutable_snapshot(self, tmp_path):
+        workspace = str(tmp_path)
+        injector = DependencyInjector(workspace)
+        snapshot = build_content_snapshot(
+            (
+                AuthoredDependencyRow(
+                    role="required",
+                    authored_index=0,
+                    binding_ref="ref",
+                    evaluated_relpath="alias.txt",
+                    canonical_target="canonical.txt",
                 ),
-                (DependencyContent("canonical.txt", b"snapshot bytes"),),
-            )
+            ),
+            (DependencyContent("canonical.txt", b"snapshot bytes"),),
+        )
 
-            result = injector.inject(
-                "prompt",
-                [],
-                {"mode": "content"},
-                content_snapshot=snapshot,
-            )
+        result = injector.inject(
+            "prompt",
+            [],
+            {"mode": "content"},
+            content_snapshot=snapshot,
+        )
 
-            assert "=== File: canonical.txt" in result.modified_prompt
-            assert "snapshot bytes" in result.modified_prompt
+        assert "=== File: canonical.txt" in result.modified_prompt
+        assert "snapshot bytes" in result.modified_prompt
 
-    def test_content_snapshot_optional_default_uses_snapshot_classification(self, monkeypatch):
-        with tempfile.TemporaryDirectory() as workspace:
-            injector = DependencyInjector(workspace)
-            snapshot = build_content_snapshot(
-                (
-                    AuthoredDependencyRow(
-                        role="optional",
-                        authored_index=0,
-                        binding_ref="optional-ref",
-                        evaluated_relpath="optional.txt",
-                        canonical_target="optional.txt",
-                    ),
+    def test_content_snapshot_optional_default_uses_snapshot_classification(self, tmp_path, monkeypatch):
+        workspace = str(tmp_path)
+        injector = DependencyInjector(workspace)
+        snapshot = build_content_snapshot(
+            (
+                AuthoredDependencyRow(
+                    role="optional",
+                    authored_index=0,
+                    binding_ref="optional-ref",
+                    evaluated_relpath="optional.txt",
+                    canonical_target="optional.txt",
                 ),
-                (DependencyContent("optional.txt", b"optional"),),
-            )
-            calls = []
-            monkeypatch.setattr(
-                injector,
-                "_get_default_instruction",
-                lambda mode, required: calls.append((mode, required)) or "sentinel",
-            )
+            ),
+            (DependencyContent("optional.txt", b"optional"),),
+        )
+        calls = []
+        monkeypatch.setattr(
+            injector,
+            "_get_default_instruction",
+            lambda mode, required: calls.append((mode, required)) or "sentinel",
+        )
 
-            result = injector.inject(
-                "",
-                [],
-                {"mode": "content"},
-                content_snapshot=snapshot,
-            )
+        result = injector.inject(
+            "",
+            [],
+            {"mode": "content"},
+            content_snapshot=snapshot,
+        )
 
-            assert result.modified_prompt.startswith("sentinel")
-            assert calls == [("content", False)]
+        assert result.modified_prompt.startswith("sentinel")
+        assert calls == [("content", False)]
 
-    def test_content_snapshot_required_default_ignores_legacy_optional_flag(self, monkeypatch):
-        with tempfile.TemporaryDirectory() as workspace:
-            injector = DependencyInjector(workspace)
-            snapshot = build_content_snapshot(
-                (
-                    AuthoredDependencyRow(
-                        role="required",
-                        authored_index=0,
-                        binding_ref="required-ref",
-                        evaluated_relpath="required.txt",
-                        canonical_target="required.txt",
-                    ),
+    def test_content_snapshot_required_default_ignores_legacy_optional_flag(self, tmp_path, monkeypatch):
+        workspace = str(tmp_path)
+        injector = DependencyInjector(workspace)
+        snapshot = build_content_snapshot(
+            (
+                AuthoredDependencyRow(
+                    role="required",
+                    authored_index=0,
+                    binding_ref="required-ref",
+                    evaluated_relpath="required.txt",
+                    canonical_target="required.txt",
                 ),
-                (DependencyContent("required.txt", b"required"),),
-            )
-            calls = []
-            monkeypatch.setattr(
-                injector,
-                "_get_default_instruction",
-                lambda mode, required: calls.append((mode, required)) or "sentinel",
-            )
+            ),
+            (DependencyContent("required.txt", b"required"),),
+        )
+        calls = []
+        monkeypatch.setattr(
+            injector,
+            "_get_default_instruction",
+            lambda mode, required: calls.append((mode, required)) or "sentinel",
+        )
 
-            result = injector.inject(
-                "",
-                [],
-                {"mode": "content"},
-                is_required=False,
-                content_snapshot=snapshot,
-            )
+        result = injector.inject(
+            "",
+            [],
+            {"mode": "content"},
+            is_required=False,
+            content_snapshot=snapshot,
+        )
 
-            assert result.modified_prompt.startswith("sentinel")
-            assert calls == [("content", True)]
+        assert result.modified_prompt.startswith("sentinel")
+        assert calls == [("content", True)]
 
     @pytest.mark.parametrize("newline_bytes", [b"one\r\ntwo\r\n", b"one\rtwo\r"])
-    def test_content_mode_keeps_legacy_universal_newline_output(self, newline_bytes):
-        with tempfile.TemporaryDirectory() as workspace:
-            Path(workspace, "newlines.txt").write_bytes(newline_bytes)
-            injector = DependencyInjector(workspace)
+    def test_content_mode_keeps_legacy_universal_newline_output(self, tmp_path, newline_bytes):
+        workspace = str(tmp_path)
+        Path(workspace, "newlines.txt").write_bytes(newline_bytes)
+        injector = DependencyInjector(workspace)
+
+        result = injector.inject("", ["newlines.txt"], {"mode": "content"})
+
+        assert "one\ntwo\n" in result.modified_prompt
+        assert "\r" not in result.modified_prompt
+
+    def test_content_mode_treats_unstattable_files_as_absent(self, tmp_path, monkeypatch):
+        """Existence checks that raise leave the row unresolved instead of aborting injection."""
+        workspace = str(tmp_path)
+        Path(workspace, "ok.txt").write_text("readable")
+        Path(workspace, "locked.txt").write_text("hidden")
+        real_exists = Path.exists
+
+        def exists(self):
+            if self.name == "locked.txt":
+                raise PermissionError("permission denied")
+            return real_exists(self)
+
+        monkeypatch.setattr(Path, "exists", exists)
+        injector = DependencyInjector(workspace)
 
-            result = injector.inject("", ["newlines.txt"], {"mode": "content"})
+        result = injector.inject(
+            "", ["ok.txt", "locked.txt", "bad\0.txt"], {"mode": "content"}, is_required=False
+        )
 
-            assert "one\ntwo\n" in result.modified_prompt
-            assert "\r" not in result.modified_prompt
+        assert "=== File: ok.txt" in result.modified_prompt
+        assert "readable" in result.modified_prompt
+        assert "hidden" not in result.modified_prompt
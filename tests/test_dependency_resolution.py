@@ -1,7 +1,7 @@
 """Tests for dependency resolution and validation (AT-22-27)."""
 
-import os
-import tempfile
+import glob
+
 import pytest
 from pathlib import Path
 
@@ -11,360 +11,467 @@ from orchestrator.deps.resolver import DependencyResolver, DependencyResolution
 class TestDependencyResolution:
     """Test dependency resolution with glob patterns."""
     
-    def test_at22_missing_required_dependencies_fails(self):
+    def test_at22_missing_required_dependencies_fails(self, tmp_path):
         """AT-22: Missing required dependencies fail with exit 2.
 
         Note: The resolver returns validation state, executor handles exit code.
         """
-        with tempfile.TemporaryDirectory() as workspace:
-            resolver = DependencyResolver(workspace)
+        workspace = str(tmp_path)
+        resolver = DependencyResolver(workspace)
 
-            depends_on = {
-                'required': ['missing_file.txt']
-            }
+        depends_on = {
+            'required': ['missing_file.txt']
+        }
 
-            # Resolver returns resolution with validation state
-            result = resolver.resolve(depends_on)
+        # Resolver returns resolution with validation state
+        result = resolver.resolve(depends_on)
 
-            # Check that validation fails
-            assert not result.is_valid
-            assert result.missing_required == ['missing_file.txt']
-            assert result.errors == ['missing_file.txt']
-            assert result.required_files == []
-            
-    def test_at23_posix_glob_matching(self):
+        # Check that validation fails
+        assert not result.is_valid
+        assert result.missing_required == ['missing_file.txt']
+        assert result.errors == ['missing_file.txt']
+        assert result.required_files == []
+        
+    def test_at23_posix_glob_matching(self, tmp_path):
         """AT-23: POSIX glob patterns match files correctly."""
-        with tempfile.TemporaryDirectory() as workspace:
-            # Create test files
-            Path(workspace, 'doc1.md').touch()
-            Path(workspace, 'doc2.md').touch()
-            Path(workspace, 'test.txt').touch()
-            Path(workspace, 'subdir').mkdir()
-            Path(workspace, 'subdir', 'doc3.md').touch()
-            
-            resolver = DependencyResolver(workspace)
-            
-            depends_on = {
-                'required': ['*.md', 'subdir/*.md']
-            }
-            
-            result = resolver.resolve(depends_on)
-            
-            # Should match all .md files in specified locations
-            assert sorted(result.required_files) == ['doc1.md', 'doc2.md', 'subdir/doc3.md']
-            assert result.missing_required == []
-            
-    def test_at24_variable_substitution_in_dependencies(self):
+        workspace = str(tmp_path)
+        # Create test files
+        Path(workspace, 'doc1.md').touch()
+        Path(workspace, 'doc2.md').touch()
+        Path(workspace, 'test.txt').touch()
+        Path(workspace, 'subdir').mkdir()
+        Path(workspace, 'subdir', 'doc3.md').touch()
+        
+        resolver = DependencyResolver(workspace)
+        
+        depends_on = {
+            'required': ['*.md', 'subdir/*.md']
+        }
+        
+        result = resolver.resolve(depends_on)
+        
+        # Should match all .md files in specified locations
+        assert sorted(result.required_files) == ['doc1.md', 'doc2.md', 'subdir/doc3.md']
+        assert result.missing_required == []
+        
+    def test_at24_variable_substitution_in_dependencies(self, tmp_path):
         """AT-24: Variables are substituted before dependency validation."""
-        with tempfile.TemporaryDirectory() as workspace:
-            # Create test files
-            Path(workspace, 'artifacts').mkdir()
-            Path(workspace, 'artifacts', 'report.md').touch()
-            
-            resolver = DependencyResolver(workspace)
-            
-            depends_on = {
-                'required': ['${artifact_dir}/report.md']
-            }
-            
-            variables = {
-                'artifact_dir': 'artifacts'
-            }
-            
-            result = resolver.resolve(depends_on, variables)
+        workspace = str(tmp_path)
+        # Create test files
+        Path(workspace, 'artifacts').mkdir()
+        Path(workspace, 'artifacts', 'report.md').touch()
+        
+        resolver = DependencyResolver(workspace)
+        
+        depends_on = {
+            'required': ['${artifact_dir}/report.md']
+        }
+        
+        variables = {
+            'artifact_dir': 'artifacts'
+        }
+        
+        result = resolver.resolve(depends_on, variables)
 
-            assert result.required_files == ['artifacts/report.md']
-            assert result.missing_required == []
+        assert result.required_files == ['artifacts/report.md']
+        assert result.missing_required == []
 
-    def test_scoped_variable_substitution_in_dependencies(self):
+    def test_scoped_variable_substitution_in_dependencies(self, tmp_path):
         """Scoped runtime namespaces are valid in dependency patterns."""
-        with tempfile.TemporaryDirectory() as workspace:
-            Path(workspace, "state").mkdir()
-            Path(workspace, "state", "architecture.md").touch()
-
-            resolver = DependencyResolver(workspace)
-
-            result = resolver.resolve(
-                {"required": ["${parent.steps.Prepare.artifacts.architecture_path}"]},
-                {
-                    "parent": {
-                        "steps": {
-                            "Prepare": {
-                                "artifacts": {
-                                    "architecture_path": "state/architecture.md",
-                                },
+        workspace = str(tmp_path)
+        Path(workspace, "state").mkdir()
+        Path(workspace, "state", "architecture.md").touch()
+
+        resolver = DependencyResolver(workspace)
+
+        result = resolver.resolve(
+            {"required": ["${parent.steps.Prepare.artifacts.architecture_path}"]},
+            {
+                "parent": {
+                    "steps": {
+                        "Prepare": {
+                            "artifacts": {
+                                "architecture_path": "state/architecture.md",
                             },
                         },
                     },
                 },
-            )
+            },
+        )
 
-            assert result.required_files == ["state/architecture.md"]
-            assert result.missing_required == []
-            
-    def test_at25_loop_dependencies_reevaluation(self):
+        assert result.required_files == ["state/architecture.md"]
+        assert result.missing_required == []
+        
+    def test_at25_loop_dependencies_reevaluation(self, tmp_path):
         """AT-25: Dependencies are re-evaluated each loop iteration.
         
         This test validates the resolver can be called multiple times
         with different variables (as would happen in a loop).
         """
-        with tempfile.TemporaryDirectory() as workspace:
-            # Create test files for different iterations
-            Path(workspace, 'item1').mkdir()
-            Path(workspace, 'item1', 'data.txt').touch()
-            Path(workspace, 'item2').mkdir()
-            Path(workspace, 'item2', 'data.txt').touch()
-            
-            resolver = DependencyResolver(workspace)
-            
-            # First iteration
-            depends_on = {
-                'required': ['${item}/data.txt']
-            }
-            
-            result1 = resolver.resolve(depends_on, {'item': 'item1'})
-            assert result1.required_files == ['item1/data.txt']
-            
-            # Second iteration - different variable value
-            result2 = resolver.resolve(depends_on, {'item': 'item2'})
-            assert result2.required_files == ['item2/data.txt']
-            
-    def test_at26_optional_dependencies_omitted(self):
+        workspace = str(tmp_path)
+        # Create test files for different iterations
+        Path(workspace, 'item1').mkdir()
+        Path(workspace, 'item1', 'data.txt').touch()
+        Path(workspace, 'item2').mkdir()
+        Path(workspace, 'item2', 'data.txt').touch()
+        
+        resolver = DependencyResolver(workspace)
+        
+        # First iteration
+        depends_on = {
+            'required': ['${item}/data.txt']
+        }
+        
+        result1 = resolver.resolve(depends_on, {'item': 'item1'})
+        assert result1.required_files == ['item1/data.txt']
+        
+        # Second iteration - different variable value
+        result2 = resolver.resolve(depends_on, {'item': 'item2'})
+        assert result2.required_files == ['item2/data.txt']
+        
+    def test_at26_optional_dependencies_omitted(self, tmp_path):
         """AT-26: Missing optional dependencies are omitted without error."""
-        with tempfile.TemporaryDirectory() as workspace:
-            # Create only some files
-            Path(workspace, 'exists.txt').touch()
-            
-            resolver = DependencyResolver(workspace)
-            
-            depends_on = {
-                'required': ['exists.txt'],
-                'optional': ['missing.txt', 'also_missing.txt']
-            }
-            
-            # Should not raise error for missing optional files
-            result = resolver.resolve(depends_on)
-            
-            assert result.required_files == ['exists.txt']
-            assert result.optional_files == []
-            assert result.missing_required == []
-            
-    def test_at26_mixed_optional_dependencies(self):
+        workspace = str(tmp_path)
+        # Create only some files
+        Path(workspace, 'exists.txt').touch()
+        
+        resolver = DependencyResolver(workspace)
+        
+        depends_on = {
+            'required': ['exists.txt'],
+            'optional': ['missing.txt', 'also_missing.txt']
+        }
+        
+        # Should not raise error for missing optional files
+        result = resolver.resolve(depends_on)
+        
+        assert result.required_files == ['exists.txt']
+        assert result.optional_files == []
+        assert result.missing_required == []
+        
+    def test_at26_mixed_optional_dependencies(self, tmp_path):
         """AT-26: Optional dependencies include only existing files."""
-        with tempfile.TemporaryDirectory() as workspace:
-            # Create some optional files
-            Path(workspace, 'optional1.txt').touch()
-            Path(workspace, 'optional3.txt').touch()
-            
-            resolver = DependencyResolver(workspace)
-            
-            depends_on = {
-                'optional': ['optional1.txt', 'optional2.txt', 'optional3.txt']
-            }
-            
-            result = resolver.resolve(depends_on)
-            
-            assert sorted(result.optional_files) == ['optional1.txt', 'optional3.txt']
-            assert result.missing_required == []
-            
-    def test_at27_dependency_error_context(self):
+        workspace = str(tmp_path)
+        # Create some optional files
+        Path(workspace, 'optional1.txt').touch()
+        Path(workspace, 'optional3.txt').touch()
+        
+        resolver = DependencyResolver(workspace)
+        
+        depends_on = {
+            'optional': ['optional1.txt', 'optional2.txt', 'optional3.txt']
+        }
+        
+        result = resolver.resolve(depends_on)
+        
+        assert sorted(result.optional_files) == ['optional1.txt', 'optional3.txt']
+        assert result.missing_required == []
+        
+    def test_at27_dependency_error_context(self, tmp_path):
         """AT-27: Dependency failures provide proper error context.
 
         The error handler (on.failure) can catch these with exit code 2.
         Note: The resolver returns validation state, executor handles exit code.
         """
-        with tempfile.TemporaryDirectory() as workspace:
-            resolver = DependencyResolver(workspace)
-
-            depends_on = {
-                'required': ['missing1.txt', 'missing2.txt']
-            }
-
-            # Resolver returns resolution with validation state
-            result = resolver.resolve(depends_on)
-
-            # Check that validation fails with proper error context
-            assert not result.is_valid
-            assert 'missing1.txt' in result.missing_required
-            assert 'missing2.txt' in result.missing_required
-            assert len(result.missing_required) == 2
-            assert result.errors == result.missing_required
-            
-    def test_deterministic_ordering(self):
+        workspace = str(tmp_path)
+        resolver = DependencyResolver(workspace)
+
+        depends_on = {
+            'required': ['missing1.txt', 'missing2.txt']
+        }
+
+        # Resolver returns resolution with validation state
+        result = resolver.resolve(depends_on)
+
+        # Check that validation fails with proper error context
+        assert not result.is_valid
+        assert 'missing1.txt' in result.missing_required
+        assert 'missing2.txt' in result.missing_required
+        assert len(result.missing_required) == 2
+        assert result.errors == result.missing_required
+        
+    def test_deterministic_ordering(self, tmp_path):
         """Files are returned in deterministic lexicographic order."""
-        with tempfile.TemporaryDirectory() as workspace:
-            # Create files in non-alphabetical order
-            Path(workspace, 'zebra.txt').touch()
-            Path(workspace, 'apple.txt').touch()
-            Path(workspace, 'middle.txt').touch()
-            
-            resolver = DependencyResolver(workspace)
-            
-            depends_on = {
-                'required': ['*.txt']
-            }
-            
-            result = resolver.resolve(depends_on)
-            
-            # Should be in lexicographic order
-            assert result.required_files == ['apple.txt', 'middle.txt', 'zebra.txt']
-            
-    def test_path_safety_absolute_path_rejected(self):
+        workspace = str(tmp_path)
+        # Create files in non-alphabetical order
+        Path(workspace, 'zebra.txt').touch()
+        Path(workspace, 'apple.txt').touch()
+        Path(workspace, 'middle.txt').touch()
+        
+        resolver = DependencyResolver(workspace)
+        
+        depends_on = {
+            'required': ['*.txt']
+        }
+        
+        result = resolver.resolve(depends_on)
+        
+        # Should be in lexicographic order
+        assert result.required_files == ['apple.txt', 'middle.txt', 'zebra.txt']
+        
+    def test_path_safety_absolute_path_rejected(self, tmp_path):
         """Absolute paths in dependencies are rejected."""
-        with tempfile.TemporaryDirectory() as workspace:
-            resolver = DependencyResolver(workspace)
-            
-            depends_on = {
-                'required': ['/etc/passwd']
-            }
-            
-            with pytest.raises(ValueError) as exc_info:
-                resolver.resolve(depends_on)
-            
-            assert "Path safety violation" in str(exc_info.value)
-            assert "absolute path" in str(exc_info.value)
-            
-    def test_path_safety_parent_traversal_rejected(self):
+        workspace = str(tmp_path)
+        resolver = DependencyResolver(workspace)
+        
+        depends_on = {
+            'required': ['/etc/passwd']
+        }
+        
+        with pytest.raises(ValueError) as exc_info:
+            resolver.resolve(depends_on)
+        
+        assert "Path safety violation" in str(exc_info.value)
+        assert "absolute path" in str(exc_info.value)
+        
+    def test_path_safety_parent_traversal_rejected(self, tmp_path):
         """Parent directory traversal in dependencies is rejected."""
-        with tempfile.TemporaryDirectory() as workspace:
-            resolver = DependencyResolver(workspace)
-            
-            depends_on = {
-                'required': ['../../../etc/passwd']
-            }
-            
-            with pytest.raises(ValueError) as exc_info:
-                resolver.resolve(depends_on)
-            
-            assert "Path safety violation" in str(exc_info.value)
-            assert "parent directory traversal" in str(exc_info.value)
-            
-    def test_symlink_escape_rejected(self):
+        workspace = str(tmp_path)
+        resolver = DependencyResolver(workspace)
+        
+        depends_on = {
+            'required': ['../../../etc/passwd']
+        }
+        
+        with pytest.raises(ValueError) as exc_info:
+            resolver.resolve(depends_on)
+        
+        assert "Path safety violation" in str(exc_info.value)
+        assert "parent directory traversal" in str(exc_info.value)
+        
+    def test_symlink_escape_rejected(self, tmp_path, tmp_path_factory):
         """Symlinks that escape workspace are rejected."""
-        with tempfile.TemporaryDirectory() as workspace:
-            # Create a symlink that points outside workspace
-            outside_dir = tempfile.mkdtemp()
-            try:
-                Path(outside_dir, 'secret.txt').touch()
-                
-                # Create symlink pointing outside
-                link_path = Path(workspace, 'link.txt')
-                link_path.symlink_to(Path(outside_dir, 'secret.txt'))
-                
-                resolver = DependencyResolver(workspace)
-                
-                depends_on = {
-                    'required': ['link.txt']
-                }
-                
-                with pytest.raises(ValueError) as exc_info:
-                    resolver.resolve(depends_on)
-                
-                assert "Path safety violation" in str(exc_info.value)
-                assert "escapes workspace" in str(exc_info.value)
-                
-            finally:
-                # Cleanup
-                Path(outside_dir, 'secret.txt').unlink()
-                os.rmdir(outside_dir)
-                
-    def test_dotfiles_not_matched_by_default(self):
-        """Dotfiles are not matched unless explicitly specified."""
-        with tempfile.TemporaryDirectory() as workspace:
-            # Create regular and dot files
-            Path(workspace, 'normal.txt').touch()
-            Path(workspace, '.hidden.txt').touch()
-            
-            resolver = DependencyResolver(workspace)
-            
-            # Wildcard should not match dotfiles
-            depends_on = {
-                'required': ['*.txt']
-            }
-            
-            result = resolver.resolve(depends_on)
-            assert result.required_files == ['normal.txt']
-            
-            # Explicit dotfile pattern should work
-            depends_on = {
-                'required': ['.hidden.txt']
-            }
-            
-            result = resolver.resolve(depends_on)
-            assert result.required_files == ['.hidden.txt']
+        workspace = str(tmp_path)
+        # Create a symlink that points outside workspace
+        outside_dir = tmp_path_factory.mktemp('outside')
+        (outside_dir / 'secret.txt').touch()
+        
+        # Create symlink pointing outside
+        link_path = Path(workspace, 'link.txt')
+        link_path.symlink_to(outside_dir / 'secret.txt')
+        
+        resolver = DependencyResolver(workspace)
+        
+        depends_on = {
+            'required': ['link.txt']
+        }
+        
+        with pytest.raises(ValueError) as exc_info:
+            resolver.resolve(depends_on)
+        
+        assert "Path safety violation" in str(exc_info.value)
+        assert "escapes workspace" in str(exc_info.value)
             
-    def test_pattern_tracking(self):
+    def test_dotfiles_not_matched_by_default(self, tmp_path):
+        """Dotfiles are not matched unless explicitly specified."""
+        workspace = str(tmp_path)
+        # Create regular and dot files
+        Path(workspace, 'normal.txt').touch()
+        Path(workspace, '.hidden.txt').touch()
+        
+        resolver = DependencyResolver(workspace)
+        
+        # Wildcard should not match dotfiles
+        depends_on = {
+            'required': ['*.txt']
+        }
+        
+        result = resolver.resolve(depends_on)
+        assert result.required_files == ['normal.txt']
+        
+        # Explicit dotfile pattern should work
+        depends_on = {
+            'required': ['.hidden.txt']
+        }
+        
+        result = resolver.resolve(depends_on)
+        assert result.required_files == ['.hidden.txt']
+        
+    def test_pattern_tracking(self, tmp_path):
         """Patterns used are tracked in resolution results."""
-        with tempfile.TemporaryDirectory() as workspace:
-            Path(workspace, 'file1.md').touch()
-            Path(workspace, 'file2.md').touch()
-            Path(workspace, 'data.json').touch()
-            
-            resolver = DependencyResolver(workspace)
-            
-            depends_on = {
-                'required': ['*.md'],
-                'optional': ['*.json']
-            }
-            
-            result = resolver.resolve(depends_on)
-            
-            assert '*.md' in result.patterns_used
-            assert sorted(result.patterns_used['*.md']) == ['file1.md', 'file2.md']
-            assert '*.json' in result.patterns_used
-            assert result.patterns_used['*.json'] == ['data.json']
-
-    def test_legacy_resolution_exposes_classified_rows(self):
-        with tempfile.TemporaryDirectory() as workspace:
-            Path(workspace, "b.txt").write_text("b")
-            Path(workspace, "a.txt").write_text("a")
-            resolver = DependencyResolver(workspace)
-
-            result = resolver.resolve(
-                {"required": ["*.txt"], "optional": ["missing.txt"]}
-            )
-
-            assert [row.role for row in result.classified_rows] == [
-                "required",
-                "required",
-                "optional",
-            ]
-            assert [row.authored_index for row in result.classified_rows] == [0, 1, 0]
-            assert [row.evaluated_relpath for row in result.classified_rows] == [
-                "a.txt",
-                "b.txt",
-                "missing.txt",
-            ]
-            assert result.classified_rows[-1].canonical_target is None
-
-    def test_exact_resolution_rejects_glob_without_calling_glob(self, monkeypatch):
-        with tempfile.TemporaryDirectory() as workspace:
-            resolver = DependencyResolver(workspace)
-            called = False
-
-            def forbidden(*args, **kwargs):
-                nonlocal called
-                called = True
-                raise AssertionError("glob must not be called")
-
-            monkeypatch.setattr("orchestrator.deps.resolver.glob.glob", forbidden)
-            with pytest.raises(ValueError, match="glob magic"):
-                resolver.resolve_exact(required=[("binding", "*.txt")])
-            assert called is False
-
-    def test_exact_resolution_classifies_present_and_absent_rows(self):
-        with tempfile.TemporaryDirectory() as workspace:
-            Path(workspace, "present.txt").write_text("present")
-            resolver = DependencyResolver(workspace)
-
-            result = resolver.resolve_exact(
-                required=[("required_binding", "present.txt")],
-                optional=[("optional_binding", "missing.txt")],
-            )
-
-            assert result.required_files == ["present.txt"]
-            assert result.optional_files == []
-            assert [(row.binding_ref, row.canonical_target) for row in result.classified_rows] == [
-                ("required_binding", "present.txt"),
-                ("optional_binding", None),
-            ]
+        workspace = str(tmp_path)
+        Path(workspace, 'file1.md').touch()
+        Path(workspace, 'file2.md').touch()
+        Path(workspace, 'data.json').touch()
+        
+        resolver = DependencyResolver(workspace)
+        
+        depends_on = {
+            'required': ['*.md'],
+            'optional': ['*.json']
+        }
+        
+        result = resolver.resolve(depends_on)
+        
+        assert '*.md' in result.patterns_used
+        assert sorted(result.patterns_used['*.md']) == ['file1.md', 'file2.md']
+        assert '*.json' in result.patterns_used
+        assert result.patterns_used['*.json'] == ['data.json']
+
+    def test_legacy_resolution_exposes_classified_rows(self, tmp_path):
+        workspace = str(tmp_path)
+        Path(workspace, "b.txt").write_text("b")
+        Path(workspace, "a.txt").write_text("a")
+        resolver = DependencyResolver(workspace)
+
+        result = resolver.resolve(
+            {"required": ["*.txt"], "optional": ["missing.txt"]}
+        )
+
+        assert [row.role for row in result.classified_rows] == [
+            "required",
+            "required",
+            "optional",
+        ]
+        assert [row.authored_index for row in result.classified_rows] == [0, 1, 0]
+        assert [row.evaluated_relpath for row in result.classified_rows] == [
+            "a.txt",
+            "b.txt",
+            "missing.txt",
+        ]
+        assert result.classified_rows[-1].canonical_target is None
+
+    def test_exact_resolution_rejects_glob_without_calling_glob(self, tmp_path, monkeypatch):
+        workspace = str(tmp_path)
+        resolver = DependencyResolver(workspace)
+        called = False
+
+        def forbidden(*args, **kwargs):
+            nonlocal called
+            called = True
+            raise AssertionError("glob must not be called")
+
+        monkeypatch.setattr("orchestrator.deps.resolver.glob.glob", forbidden)
+        with pytest.raises(ValueError, match="glob magic"):
+            resolver.resolve_exact(required=[("binding", "*.txt")])
+        assert called is False
+
+    def test_exact_resolution_classifies_present_and_absent_rows(self, tmp_path):
+        workspace = str(tmp_path)
+        Path(workspace, "present.txt").write_text("present")
+        resolver = DependencyResolver(workspace)
+
+        result = resolver.resolve_exact(
+            required=[("required_binding", "present.txt")],
+            optional=[("optional_binding", "missing.txt")],
+        )
+
+        assert result.required_files == ["present.txt"]
+        assert result.optional_files == []
+        assert [(row.binding_ref, row.canonical_target) for row in result.classified_rows] == [
+            ("required_binding", "present.txt"),
+            ("optional_binding", None),
+        ]
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("docs/*/", ["docs/a.md"]),
+            ("notes.md/", ["notes.md"]),
+            ("*/", ["docs", "notes.md"]),
+            ("./docs/*.md", ["docs/a.md"]),
+            ("./notes.md", ["notes.md"]),
+            ("docs//a.md", ["docs/a.md"]),
+            ("docs//*.md", ["docs/a.md"]),
+        ],
+    )
+    def test_patterns_normalized_like_workspace_join(self, tmp_path, pattern, expected):
+        """Trailing, repeated and './' separators normalize away as in a Path join."""
+        workspace = str(tmp_path)
+        Path(workspace, "docs").mkdir()
+        Path(workspace, "docs", "a.md").touch()
+        Path(workspace, "notes.md").touch()
+
+        resolver = DependencyResolver(workspace)
+        result = resolver.resolve({"required": [pattern]})
+
+        assert result.required_files == expected
+
+    def test_wildcard_through_symlinked_dir_canonicalizes(self, tmp_path):
+        """Matches reached through an in-workspace symlinked dir resolve to their target."""
+        workspace = str(tmp_path)
+        Path(workspace, "sub").mkdir()
+        Path(workspace, "sub", "c.md").touch()
+        Path(workspace, "lnk").symlink_to(Path(workspace, "sub"))
+
+        resolver = DependencyResolver(workspace)
+        result = resolver.resolve({"required": ["lnk/*.md"]})
+
+        assert result.required_files == ["sub/c.md"]
+        assert [row.evaluated_relpath for row in result.classified_rows] == ["lnk/c.md"]
+
+    def test_wildcard_matched_symlink_escape_rejected(self, tmp_path, tmp_path_factory):
+        """A symlink selected by a wildcard cannot escape the workspace."""
+        workspace = str(tmp_path)
+        outside_dir = tmp_path_factory.mktemp("outside")
+        (outside_dir / "secret.txt").touch()
+        Path(workspace, "a.txt").touch()
+        Path(workspace, "b.txt").symlink_to(outside_dir / "secret.txt")
+
+        resolver = DependencyResolver(workspace)
+
+        with pytest.raises(ValueError) as exc_info:
+            resolver.resolve({"required": ["*.txt"]})
+
+        assert "escapes workspace" in str(exc_info.value)
+
+    def test_dangling_symlink_resolves_to_link_target(self, tmp_path):
+        """Dangling symlinks are matched and canonicalized to their lexical target."""
+        workspace = str(tmp_path)
+        Path(workspace, "gone.md").symlink_to(Path(workspace, "missing.md"))
+
+        resolver = DependencyResolver(workspace)
+
+        assert resolver.resolve({"required": ["*.md"]}).required_files == ["missing.md"]
+        assert resolver.resolve({"required": ["gone.md"]}).required_files == ["missing.md"]
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "*",
+            "*.md",
+            ".*",
+            "*/*",
+            "*/.*",
+            "docs/[ab].md",
+            "docs/[!a]*",
+            "d?cs/*.md",
+            "lnk/*",
+            "lnk/[a-c].md",
+            "*/c.md",
+            "docs/a.md",
+            "lnk/c.md",
+            "dangling.md",
+            "docs/",
+            "*/",
+            "./docs//*.md",
+            "missing/*.md",
+        ],
+    )
+    def test_pattern_matches_glob_and_resolve(self, tmp_path, pattern):
+        """Expansion agrees with glob.glob over the workspace join plus resolve()."""
+        workspace = str(tmp_path)
+        Path(workspace, "docs").mkdir()
+        Path(workspace, "docs", "a.md").touch()
+        Path(workspace, "docs", "b.md").touch()
+        Path(workspace, "docs", ".draft.md").touch()
+        Path(workspace, ".hidden").mkdir()
+        Path(workspace, ".hidden", "h.md").touch()
+        Path(workspace, "sub").mkdir()
+        Path(workspace, "sub", "c.md").touch()
+        Path(workspace, "top.md").touch()
+        Path(workspace, ".top.md").touch()
+        Path(workspace, "lnk").symlink_to(Path(workspace, "sub"))
+        Path(workspace, "alias.md").symlink_to(Path(workspace, "docs", "a.md"))
+        Path(workspace, "dangling.md").symlink_to(Path(workspace, "nowhere.md"))
+
+        expected = sorted(
+            Path(match).resolve().relative_to(tmp_path).as_posix()
+            for match in glob.glob(str(tmp_path / pattern), recursive=False)
+        )
+
+        resolver = DependencyResolver(workspace)
+        result = resolver.resolve({"optional": [pattern]})
+
+        assert result.patterns_used.get(pattern, []) == expected
+        assert result.optional_files == list(dict.fromkeys(expected))
@@ -4,6 +4,8 @@ Validates that commands are executed safely without shell injection risks.
 """
 
 import pytest
+import shlex
+import subprocess
 import tempfile
 from pathlib import Path
 
@@ -141,6 +143,50 @@ class TestExecutionSafety:
         assert "single quotes" in output
         assert "bare_arg" in output
 
+    @pytest.mark.parametrize(
+        "command",
+        ["echo  plain\targs\n", "echo 'a b' c", "echo a\\ b", "echo a\x0bb", "echo a\u00a0b"],
+        ids=["plain", "quoted", "escaped", "vertical-tab", "nbsp"],
+    )
+    def test_string_command_tokenized_like_shlex(self, tmp_path, monkeypatch, command):
+        """String commands split exactly as shlex.split would, fast path or not."""
+        calls = []
+
+        def fake_run(argv, **kwargs):
+            calls.append(argv)
+            return subprocess.CompletedProcess(argv, 0, b"", b"")
+
+        monkeypatch.setattr("orchestrator.exec.step_executor.subprocess.run", fake_run)
+        StepExecutor(tmp_path).execute_command(step_name="test", command=command)
+
+        assert calls == [shlex.split(command)]
+
+    def test_child_env_passed_only_when_it_differs_from_os_environ(self, tmp_path, monkeypatch):
+        """env= reaches subprocess.run only when the composed environment differs from os.environ."""
+        calls = []
+
+        def fake_run(argv, **kwargs):
+            calls.append(kwargs)
+            return subprocess.CompletedProcess(argv, 0, b"", b"")
+
+        monkeypatch.setattr("orchestrator.exec.step_executor.subprocess.run", fake_run)
+        monkeypatch.delenv("PYTHONPATH", raising=False)
+        monkeypatch.setenv("DECLARED_SECRET", "s3cret")
+        executor = StepExecutor(tmp_path)
+
+        executor.execute_command(step_name="plain", command=["echo", "hi"])
+        executor.execute_command(step_name="secret", command=["echo", "hi"], secrets=["DECLARED_SECRET"])
+        executor.execute_command(step_name="step_env", command=["echo", "hi"], env={"STEP_VAR": "1"})
+        executor.execute_command(step_name="pythonpath", command=["python", "-m", "orchestrator.cli"])
+        executor.execute_command(step_name="same_env", command=["echo", "hi"], env={"DECLARED_SECRET": "s3cret"})
+
+        plain, secret, step_env, pythonpath, same_env = calls
+        assert "env" not in plain
+        assert "env" not in secret
+        assert "env" not in same_env
+        assert step_env["env"]["STEP_VAR"] == "1"
+        assert pythonpath["env"]["PYTHONPATH"]
+
     def test_invalid_command_type_rejected(self, tmp_path):
         """Test that invalid command types are rejected."""
         executor = StepExecutor(tmp_path)
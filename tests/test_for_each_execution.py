@@ -5,9 +5,6 @@ Tests AT-3 and AT-13: Dynamic for-each with pointer resolution.
 
 import pytest
 import json
-from pathlib import Path
-import tempfile
-import shutil
 
 from orchestrator.workflow.executor import WorkflowExecutor
 from orchestrator.workflow.pointers import PointerResolver
@@ -145,19 +142,15 @@ class TestPointerResolution:
 class TestForEachExecution:
     """Test for-each loop execution in workflows."""
 
-    def setup_method(self):
-        """Setup test environment."""
-        self.test_dir = Path(tempfile.mkdtemp(prefix='test_for_each_'))
+    @pytest.fixture(autouse=True)
+    def _isolated_test_workspace(self, tmp_path):
+        """Give each test a pytest-managed workspace."""
+        self.test_dir = tmp_path
         self.workspace = self.test_dir / 'workspace'
         self.workspace.mkdir()
         self.state_dir = self.test_dir / '.orchestrate'
         self.state_dir.mkdir()
 
-    def teardown_method(self):
-        """Cleanup test environment."""
-        if self.test_dir.exists():
-            shutil.rmtree(self.test_dir)
-
     def test_at3_for_each_dynamic_items(self):
         """AT-3: Dynamic for-each with items_from executes correctly."""
         # Create a workflow with for_each using items_from
@@ -217,7 +210,7 @@ class TestForEachExecution:
         )
 
         # Mock the command execution to avoid actual subprocess calls
-        def mock_execute_command(self, **kwargs):
+        def mock_execute_command(**kwargs):
             step_name = kwargs['step_name']
             command = kwargs['command']
 
@@ -260,8 +253,7 @@ class TestForEachExecution:
                 )
 
         # Patch the executor's command execution
-        import types
-        executor.step_executor.execute_command = types.MethodType(mock_execute_command, executor.step_executor)
+        executor.step_executor.execute_command = mock_execute_command
 
         # Execute
         state = executor.execute()
@@ -347,7 +339,7 @@ class TestForEachExecution:
         )
 
         # Mock execution
-        def mock_execute_command(self, **kwargs):
+        def mock_execute_command(**kwargs):
             command = kwargs['command']
 
             # Convert command to string for checking
@@ -385,8 +377,7 @@ class TestForEachExecution:
                     duration_ms=5
                 )
 
-        import types
-        executor.step_executor.execute_command = types.MethodType(mock_execute_command, executor.step_executor)
+        executor.step_executor.execute_command = mock_execute_command
 
         # Execute
         state = executor.execute()
@@ -511,7 +502,7 @@ class TestForEachExecution:
         )
 
         # Mock GetValue execution
-        def mock_execute_command(self, **kwargs):
+        def mock_execute_command(**kwargs):
             if 'GetValue' in kwargs['step_name']:
                 from orchestrator.exec.output_capture import CaptureResult, CaptureMode
                 result = CaptureResult(
@@ -528,8 +519,7 @@ class TestForEachExecution:
                     duration_ms=10
                 )
 
-        import types
-        executor.step_executor.execute_command = types.MethodType(mock_execute_command, executor.step_executor)
+        executor.step_executor.execute_command = mock_execute_command
 
         # Execute
         state = executor.execute()
@@ -592,7 +582,7 @@ class TestForEachExecution:
         # Mock execution to capture variable substitution
         executed_commands = []
 
-        def mock_execute_command(self, **kwargs):
+        def mock_execute_command(**kwargs):
             command = kwargs['command']
             executed_commands.append(command)
 
@@ -610,8 +600,7 @@ class TestForEachExecution:
                 duration_ms=5
             )
 
-        import types
-        executor.step_executor.execute_command = types.MethodType(mock_execute_command, executor.step_executor)
+        executor.step_executor.execute_command = mock_execute_command
 
         # Execute
         state = executor.execute()
@@ -673,7 +662,7 @@ class TestForEachExecution:
 
         executed_commands = []
 
-        def mock_execute_command(self, **kwargs):
+        def mock_execute_command(**kwargs):
             command = kwargs['command']
             command_text = ' '.join(command) if isinstance(command, list) else command
             executed_commands.append(command_text)
@@ -692,8 +681,7 @@ class TestForEachExecution:
                 duration_ms=5
             )
 
-        import types
-        executor.step_executor.execute_command = types.MethodType(mock_execute_command, executor.step_executor)
+        executor.step_executor.execute_command = mock_execute_command
 
         state = executor.execute()
         persisted = state_manager.load()
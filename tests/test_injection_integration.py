@@ -4,17 +4,29 @@ Acceptance tests: AT-28-35, AT-53
 """
 
 import pytest
-import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 import json
 
 from orchestrator.workflow.executor import WorkflowExecutor
 from orchestrator.state import StateManager
-from orchestrator.providers.executor import ProviderExecutionResult
-from orchestrator.exceptions import WorkflowValidationError
+from orchestrator.providers.registry import ProviderRegistry
+from orchestrator.providers.types import ProviderTemplate, InputMode
 from tests.workflow_bundle_helpers import load_workflow_bundle_for_test
 
+# 300KB, over the 256KB injection limit
+LARGE_PAYLOAD = b"x" * (300 * 1024)
+
+# Successful provider launch; the executor only reads these three attributes
+PROVIDER_RESULT_OK = SimpleNamespace(returncode=0, stdout=b"OK", stderr=b"")
+
+CLAUDE_TEMPLATE = ProviderTemplate(
+    name="claude",
+    command=["claude", "--model", "${model}", "-p", "${PROMPT}"],
+    defaults={"model": "claude-sonnet"},
+    input_mode=InputMode.ARGV
+)
+
 
 def create_workflow_file(workspace: Path, workflow: dict, filename: str = "test.yaml") -> str:
     """Helper to create workflow file on disk for StateManager."""
@@ -25,37 +37,55 @@ def create_workflow_file(workspace: Path, workflow: dict, filename: str = "test.
 
 
 @pytest.fixture
-def temp_workspace():
+def temp_workspace(tmp_path):
     """Create temporary workspace directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace = Path(tmpdir)
-        (workspace / "artifacts").mkdir()
-        (workspace / "artifacts/architect").mkdir()
-        (workspace / "prompts").mkdir()
-        (workspace / "processed").mkdir()
-        (workspace / ".orchestrate").mkdir()
-        (workspace / ".orchestrate/runs").mkdir()
-        yield workspace
+    for subdir in ("artifacts/architect", "prompts", "processed", ".orchestrate/runs"):
+        (tmp_path / subdir).mkdir(parents=True)
+    return tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_provider_registry():
     """Mock provider registry with test provider."""
-    from orchestrator.providers.registry import ProviderRegistry
-    from orchestrator.providers.types import ProviderTemplate, InputMode
-
     registry = ProviderRegistry()
-    template = ProviderTemplate(
-        name="claude",
-        command=["claude", "--model", "${model}", "-p", "${PROMPT}"],
-        defaults={"model": "claude-sonnet"},
-        input_mode=InputMode.ARGV
-    )
-    registry._providers["claude"] = template
+    registry._providers["claude"] = CLAUDE_TEMPLATE
     return registry
 
 
-def test_at28_basic_injection(temp_workspace, mock_provider_registry):
+@pytest.fixture(autouse=True)
+def provider_commands(monkeypatch):
+    """Stub provider subprocess launches, recording each launched command."""
+    commands = []
+
+    def fake_run(command, *args, **kwargs):
+        commands.append(command)
+        return PROVIDER_RESULT_OK
+
+    monkeypatch.setattr('orchestrator.providers.executor.subprocess.run', fake_run)
+    return commands
+
+
+def run_workflow(workspace: Path, registry, workflow: dict, filename: str = "test.yaml"):
+    """Execute a workflow against the mock provider registry and return the final state."""
+    # Create workflow file and state manager
+    workflow_file = create_workflow_file(workspace, workflow, filename)
+    state_manager = StateManager(workspace)
+    state_manager.initialize(workflow_file, {})
+
+    executor = WorkflowExecutor(
+        workflow=load_workflow_bundle_for_test(workspace, workflow_file),
+        workspace=workspace,
+        state_manager=state_manager,
+        provider_observation_enabled=False,
+    )
+
+    # Override provider registry
+    executor.provider_registry = registry
+
+    return executor.execute()
+
+
+def test_at28_basic_injection(temp_workspace, mock_provider_registry, provider_commands):
     """AT-28: Basic injection with inject: true prepends default instruction + file list."""
     # Create test files
     (temp_workspace / "artifacts/architect/design.md").write_text("Design document")
@@ -78,67 +108,34 @@ def test_at28_basic_injection(temp_workspace, mock_provider_registry):
         ]
     }
 
-    # Mock provider execution
-    with patch.object(mock_provider_registry, 'get') as mock_get:
-        mock_get.return_value = mock_provider_registry._providers['claude']
-
-        with patch('orchestrator.providers.executor.subprocess.run') as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout=b"Success",
-                stderr=b""
-            )
-
-            # Write workflow to file for state manager
-            workflow_file = temp_workspace / 'test_workflow.yaml'
-            workflow_file.write_text(json.dumps(workflow))
-
-            # Create workflow file and state manager
-            workflow_file = create_workflow_file(temp_workspace, workflow, 'test_workflow.yaml')
-            state_manager = StateManager(temp_workspace)
+    # Execute with mocked provider
+    state = run_workflow(temp_workspace, mock_provider_registry, workflow, 'test_workflow.yaml')
 
-            # Initialize state
-            state_manager.initialize(workflow_file, {})
+    # Verify provider was called with injected prompt
+    assert provider_commands
 
-            # Execute workflow
-            executor = WorkflowExecutor(
-                workflow=load_workflow_bundle_for_test(temp_workspace, workflow_file),
-                workspace=temp_workspace,
-                state_manager=state_manager,
-                provider_observation_enabled=False,
-            )
+    # Check that the command includes the PROMPT placeholder substitution
+    command = provider_commands[-1]
+    assert "claude" in command
+    assert "--model" in command
 
-            # Override provider registry
-            executor.provider_registry = mock_provider_registry
+    # Find the prompt argument (after -p)
+    p_index = command.index("-p")
+    injected_prompt = command[p_index + 1]
 
-            state = executor.execute()
+    # Verify injection structure
+    assert "The following required files are available:" in injected_prompt
+    assert "- artifacts/architect/api.md" in injected_prompt
+    assert "- artifacts/architect/design.md" in injected_prompt
+    assert "Please implement the feature" in injected_prompt
 
-            # Verify provider was called with injected prompt
-            call_args = mock_run.call_args
-            assert call_args is not None
+    # Files should be in lexicographic order
+    api_pos = injected_prompt.index("api.md")
+    design_pos = injected_prompt.index("design.md")
+    assert api_pos < design_pos
 
-            # Check that the command includes the PROMPT placeholder substitution
-            command = call_args[0][0]
-            assert "claude" in command
-            assert "--model" in command
 
-            # Find the prompt argument (after -p)
-            p_index = command.index("-p")
-            injected_prompt = command[p_index + 1]
-
-            # Verify injection structure
-            assert "The following required files are available:" in injected_prompt
-            assert "- artifacts/architect/api.md" in injected_prompt
-            assert "- artifacts/architect/design.md" in injected_prompt
-            assert "Please implement the feature" in injected_prompt
-
-            # Files should be in lexicographic order
-            api_pos = injected_prompt.index("api.md")
-            design_pos = injected_prompt.index("design.md")
-            assert api_pos < design_pos
-
-
-def test_at29_list_mode_injection(temp_workspace, mock_provider_registry):
+def test_at29_list_mode_injection(temp_workspace, mock_provider_registry, provider_commands):
     """AT-29: List mode injection correctly lists all resolved file paths."""
     # Create multiple test files
     files = ["doc1.md", "doc2.md", "doc3.md"]
@@ -166,44 +163,22 @@ def test_at29_list_mode_injection(temp_workspace, mock_provider_registry):
         ]
     }
 
-    with patch.object(mock_provider_registry, 'get') as mock_get:
-        mock_get.return_value = mock_provider_registry._providers['claude']
-
-        with patch('orchestrator.providers.executor.subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0, stdout=b"OK", stderr=b"")
-
-            # Create workflow file and state manager
-            workflow_file = create_workflow_file(temp_workspace, workflow)
-            state_manager = StateManager(temp_workspace)
-            state_manager.initialize(workflow_file, {})
-
-            # Execute workflow
-            executor = WorkflowExecutor(
-                workflow=load_workflow_bundle_for_test(temp_workspace, workflow_file),
-                workspace=temp_workspace,
-                state_manager=state_manager,
-                provider_observation_enabled=False,
-            )
-
-            # Override provider registry
-            executor.provider_registry = mock_provider_registry
-
-            state = executor.execute()
+    state = run_workflow(temp_workspace, mock_provider_registry, workflow)
 
-            command = mock_run.call_args[0][0]
-            p_index = command.index("-p")
-            injected = command[p_index + 1]
+    command = provider_commands[-1]
+    p_index = command.index("-p")
+    injected = command[p_index + 1]
 
-            # Verify custom instruction
-            assert "Available documentation:" in injected
-            # All files should be listed
-            for f in files:
-                assert f"- {f}" in injected
-            # Original prompt should follow
-            assert "Task prompt" in injected
+    # Verify custom instruction
+    assert "Available documentation:" in injected
+    # All files should be listed
+    for f in files:
+        assert f"- {f}" in injected
+    # Original prompt should follow
+    assert "Task prompt" in injected
 
 
-def test_at30_content_mode_injection(temp_workspace, mock_provider_registry):
+def test_at30_content_mode_injection(temp_workspace, mock_provider_registry, provider_commands):
     """AT-30: Content mode includes file contents with truncation metadata."""
     # Create test file with content
     (temp_workspace / "data.txt").write_text("This is the data content\nWith multiple lines")
@@ -227,43 +202,21 @@ def test_at30_content_mode_injection(temp_workspace, mock_provider_registry):
         ]
     }
 
-    with patch.object(mock_provider_registry, 'get') as mock_get:
-        mock_get.return_value = mock_provider_registry._providers['claude']
-
-        with patch('orchestrator.providers.executor.subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0, stdout=b"OK", stderr=b"")
-
-            # Create workflow file and state manager
-            workflow_file = create_workflow_file(temp_workspace, workflow)
-            state_manager = StateManager(temp_workspace)
-            state_manager.initialize(workflow_file, {})
-
-            # Execute workflow
-            executor = WorkflowExecutor(
-                workflow=load_workflow_bundle_for_test(temp_workspace, workflow_file),
-                workspace=temp_workspace,
-                state_manager=state_manager,
-                provider_observation_enabled=False,
-            )
-
-            # Override provider registry
-            executor.provider_registry = mock_provider_registry
+    state = run_workflow(temp_workspace, mock_provider_registry, workflow)
 
-            state = executor.execute()
+    command = provider_commands[-1]
+    p_index = command.index("-p")
+    injected = command[p_index + 1]
 
-            command = mock_run.call_args[0][0]
-            p_index = command.index("-p")
-            injected = command[p_index + 1]
+    # Verify content mode format
+    assert "=== File: data.txt" in injected
+    assert "bytes) ===" in injected
+    assert "This is the data content" in injected
+    assert "With multiple lines" in injected
+    assert "Analyze this data" in injected
 
-            # Verify content mode format
-            assert "=== File: data.txt" in injected
-            assert "bytes) ===" in injected
-            assert "This is the data content" in injected
-            assert "With multiple lines" in injected
-            assert "Analyze this data" in injected
 
-
-def test_at31_custom_instruction(temp_workspace, mock_provider_registry):
+def test_at31_custom_instruction(temp_workspace, mock_provider_registry, provider_commands):
     """AT-31: Custom instruction overrides default text."""
     (temp_workspace / "spec.md").write_text("Specification")
     (temp_workspace / "prompts/impl.md").write_text("Implementation task")
@@ -287,41 +240,19 @@ def test_at31_custom_instruction(temp_workspace, mock_provider_registry):
         ]
     }
 
-    with patch.object(mock_provider_registry, 'get') as mock_get:
-        mock_get.return_value = mock_provider_registry._providers['claude']
-
-        with patch('orchestrator.providers.executor.subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0, stdout=b"OK", stderr=b"")
-
-            # Create workflow file and state manager
-            workflow_file = create_workflow_file(temp_workspace, workflow)
-            state_manager = StateManager(temp_workspace)
-            state_manager.initialize(workflow_file, {})
-
-            # Execute workflow
-            executor = WorkflowExecutor(
-                workflow=load_workflow_bundle_for_test(temp_workspace, workflow_file),
-                workspace=temp_workspace,
-                state_manager=state_manager,
-                provider_observation_enabled=False,
-            )
+    state = run_workflow(temp_workspace, mock_provider_registry, workflow)
 
-            # Override provider registry
-            executor.provider_registry = mock_provider_registry
+    command = provider_commands[-1]
+    p_index = command.index("-p")
+    injected = command[p_index + 1]
 
-            state = executor.execute()
+    # Custom instruction should be used
+    assert "You must follow these specs precisely:" in injected
+    # Default instruction should not appear
+    assert "The following required files" not in injected
 
-            command = mock_run.call_args[0][0]
-            p_index = command.index("-p")
-            injected = command[p_index + 1]
 
-            # Custom instruction should be used
-            assert "You must follow these specs precisely:" in injected
-            # Default instruction should not appear
-            assert "The following required files" not in injected
-
-
-def test_at32_append_position(temp_workspace, mock_provider_registry):
+def test_at32_append_position(temp_workspace, mock_provider_registry, provider_commands):
     """AT-32: Append position places injection after prompt content."""
     (temp_workspace / "ref.txt").write_text("Reference material")
     (temp_workspace / "prompts/main.md").write_text("Main task description")
@@ -345,41 +276,19 @@ def test_at32_append_position(temp_workspace, mock_provider_registry):
         ]
     }
 
-    with patch.object(mock_provider_registry, 'get') as mock_get:
-        mock_get.return_value = mock_provider_registry._providers['claude']
-
-        with patch('orchestrator.providers.executor.subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0, stdout=b"OK", stderr=b"")
-
-            # Create workflow file and state manager
-            workflow_file = create_workflow_file(temp_workspace, workflow)
-            state_manager = StateManager(temp_workspace)
-            state_manager.initialize(workflow_file, {})
-
-            # Execute workflow
-            executor = WorkflowExecutor(
-                workflow=load_workflow_bundle_for_test(temp_workspace, workflow_file),
-                workspace=temp_workspace,
-                state_manager=state_manager,
-                provider_observation_enabled=False,
-            )
+    state = run_workflow(temp_workspace, mock_provider_registry, workflow)
 
-            # Override provider registry
-            executor.provider_registry = mock_provider_registry
+    command = provider_commands[-1]
+    p_index = command.index("-p")
+    injected = command[p_index + 1]
 
-            state = executor.execute()
+    # Main prompt should come first
+    main_pos = injected.index("Main task description")
+    ref_pos = injected.index("Additional references:")
+    assert main_pos < ref_pos
 
-            command = mock_run.call_args[0][0]
-            p_index = command.index("-p")
-            injected = command[p_index + 1]
 
-            # Main prompt should come first
-            main_pos = injected.index("Main task description")
-            ref_pos = injected.index("Additional references:")
-            assert main_pos < ref_pos
-
-
-def test_at33_pattern_injection(temp_workspace, mock_provider_registry):
+def test_at33_pattern_injection(temp_workspace, mock_provider_registry, provider_commands):
     """AT-33: Glob patterns resolve to full list before injection."""
     # Create multiple matching files
     (temp_workspace / "docs").mkdir()
@@ -403,41 +312,19 @@ def test_at33_pattern_injection(temp_workspace, mock_provider_registry):
         ]
     }
 
-    with patch.object(mock_provider_registry, 'get') as mock_get:
-        mock_get.return_value = mock_provider_registry._providers['claude']
-
-        with patch('orchestrator.providers.executor.subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0, stdout=b"OK", stderr=b"")
-
-            # Create workflow file and state manager
-            workflow_file = create_workflow_file(temp_workspace, workflow)
-            state_manager = StateManager(temp_workspace)
-            state_manager.initialize(workflow_file, {})
+    state = run_workflow(temp_workspace, mock_provider_registry, workflow)
 
-            # Execute workflow
-            executor = WorkflowExecutor(
-                workflow=load_workflow_bundle_for_test(temp_workspace, workflow_file),
-                workspace=temp_workspace,
-                state_manager=state_manager,
-                provider_observation_enabled=False,
-            )
+    command = provider_commands[-1]
+    p_index = command.index("-p")
+    injected = command[p_index + 1]
 
-            # Override provider registry
-            executor.provider_registry = mock_provider_registry
+    # All matching files should be listed
+    assert "- docs/guide0.md" in injected
+    assert "- docs/guide1.md" in injected
+    assert "- docs/guide2.md" in injected
 
-            state = executor.execute()
 
-            command = mock_run.call_args[0][0]
-            p_index = command.index("-p")
-            injected = command[p_index + 1]
-
-            # All matching files should be listed
-            assert "- docs/guide0.md" in injected
-            assert "- docs/guide1.md" in injected
-            assert "- docs/guide2.md" in injected
-
-
-def test_at34_optional_file_injection(temp_workspace, mock_provider_registry):
+def test_at34_optional_file_injection(temp_workspace, mock_provider_registry, provider_commands):
     """AT-34: Missing optional files omitted from injection without error."""
     # Only create one of two optional files
     (temp_workspace / "exists.txt").write_text("This file exists")
@@ -462,43 +349,21 @@ def test_at34_optional_file_injection(temp_workspace, mock_provider_registry):
         ]
     }
 
-    with patch.object(mock_provider_registry, 'get') as mock_get:
-        mock_get.return_value = mock_provider_registry._providers['claude']
-
-        with patch('orchestrator.providers.executor.subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0, stdout=b"OK", stderr=b"")
-
-            # Create workflow file and state manager
-            workflow_file = create_workflow_file(temp_workspace, workflow)
-            state_manager = StateManager(temp_workspace)
-            state_manager.initialize(workflow_file, {})
+    state = run_workflow(temp_workspace, mock_provider_registry, workflow)
 
-            # Execute workflow
-            executor = WorkflowExecutor(
-                workflow=load_workflow_bundle_for_test(temp_workspace, workflow_file),
-                workspace=temp_workspace,
-                state_manager=state_manager,
-                provider_observation_enabled=False,
-            )
+    # Should succeed despite missing optional file
+    assert state['steps']['optional_test']['status'] == 'completed'
 
-            # Override provider registry
-            executor.provider_registry = mock_provider_registry
+    command = provider_commands[-1]
+    p_index = command.index("-p")
+    injected = command[p_index + 1]
 
-            state = executor.execute()
+    # Only existing file should be listed
+    assert "- exists.txt" in injected
+    assert "missing.txt" not in injected
 
-            # Should succeed despite missing optional file
-            assert state['steps']['optional_test']['status'] == 'completed'
 
-            command = mock_run.call_args[0][0]
-            p_index = command.index("-p")
-            injected = command[p_index + 1]
-
-            # Only existing file should be listed
-            assert "- exists.txt" in injected
-            assert "missing.txt" not in injected
-
-
-def test_at35_no_injection_default(temp_workspace, mock_provider_registry):
+def test_at35_no_injection_default(temp_workspace, mock_provider_registry, provider_commands):
     """AT-35: Without inject field, prompt unchanged."""
     (temp_workspace / "required.txt").write_text("Required file")
     (temp_workspace / "prompts/task.md").write_text("Original task prompt")
@@ -518,42 +383,20 @@ def test_at35_no_injection_default(temp_workspace, mock_provider_registry):
         ]
     }
 
-    with patch.object(mock_provider_registry, 'get') as mock_get:
-        mock_get.return_value = mock_provider_registry._providers['claude']
-
-        with patch('orchestrator.providers.executor.subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0, stdout=b"OK", stderr=b"")
+    state = run_workflow(temp_workspace, mock_provider_registry, workflow)
 
-            # Create workflow file and state manager
-            workflow_file = create_workflow_file(temp_workspace, workflow)
-            state_manager = StateManager(temp_workspace)
-            state_manager.initialize(workflow_file, {})
+    command = provider_commands[-1]
+    p_index = command.index("-p")
+    prompt = command[p_index + 1]
 
-            # Execute workflow
-            executor = WorkflowExecutor(
-                workflow=load_workflow_bundle_for_test(temp_workspace, workflow_file),
-                workspace=temp_workspace,
-                state_manager=state_manager,
-                provider_observation_enabled=False,
-            )
+    # Prompt should be unchanged
+    assert prompt == "Original task prompt"
+    # No injection content
+    assert "required.txt" not in prompt
+    assert "files are available" not in prompt
 
-            # Override provider registry
-            executor.provider_registry = mock_provider_registry
 
-            state = executor.execute()
-
-            command = mock_run.call_args[0][0]
-            p_index = command.index("-p")
-            prompt = command[p_index + 1]
-
-            # Prompt should be unchanged
-            assert prompt == "Original task prompt"
-            # No injection content
-            assert "required.txt" not in prompt
-            assert "files are available" not in prompt
-
-
-def test_at53_injection_shorthand(temp_workspace, mock_provider_registry):
+def test_at53_injection_shorthand(temp_workspace, mock_provider_registry, provider_commands):
     """AT-53: inject:true shorthand equals {mode:list, position:prepend}."""
     (temp_workspace / "spec.txt").write_text("Spec")
     (temp_workspace / "prompts/task.md").write_text("Task")
@@ -596,32 +439,11 @@ def test_at53_injection_shorthand(temp_workspace, mock_provider_registry):
     injected_prompts = []
 
     for i, workflow in enumerate([workflow1, workflow2]):
-        with patch.object(mock_provider_registry, 'get') as mock_get:
-            mock_get.return_value = mock_provider_registry._providers['claude']
-
-            with patch('orchestrator.providers.executor.subprocess.run') as mock_run:
-                mock_run.return_value = Mock(returncode=0, stdout=b"OK", stderr=b"")
-
-                # Create workflow file and state manager
-                workflow_file = create_workflow_file(temp_workspace, workflow, f"test_{i}.yaml")
-                state_manager = StateManager(temp_workspace)
-                state_manager.initialize(workflow_file, {})
-
-                executor = WorkflowExecutor(
-                    workflow=load_workflow_bundle_for_test(temp_workspace, workflow_file),
-                    workspace=temp_workspace,
-                    state_manager=state_manager,
-                    provider_observation_enabled=False,
-                )
-
-                # Override provider registry
-                executor.provider_registry = mock_provider_registry
-
-                state = executor.execute()
+        state = run_workflow(temp_workspace, mock_provider_registry, workflow, f"test_{i}.yaml")
 
-                command = mock_run.call_args[0][0]
-                p_index = command.index("-p")
-                injected_prompts.append(command[p_index + 1])
+        command = provider_commands[-1]
+        p_index = command.index("-p")
+        injected_prompts.append(command[p_index + 1])
 
     # Both forms should produce identical results
     assert injected_prompts[0] == injected_prompts[1]
@@ -633,8 +455,7 @@ def test_at53_injection_shorthand(temp_workspace, mock_provider_registry):
 def test_injection_truncation_debug_record(temp_workspace, mock_provider_registry):
     """Test that truncation metadata is recorded in debug.injection."""
     # Create a large file that will trigger truncation
-    large_content = "x" * (300 * 1024)  # 300KB, over the 256KB limit
-    (temp_workspace / "large.txt").write_text(large_content)
+    (temp_workspace / "large.txt").write_bytes(LARGE_PAYLOAD)
     (temp_workspace / "prompts/task.md").write_text("Task")
 
     workflow = {
@@ -654,44 +475,22 @@ def test_injection_truncation_debug_record(temp_workspace, mock_provider_registr
         ]
     }
 
-    with patch.object(mock_provider_registry, 'get') as mock_get:
-        mock_get.return_value = mock_provider_registry._providers['claude']
+    state = run_workflow(temp_workspace, mock_provider_registry, workflow)
 
-        with patch('orchestrator.providers.executor.subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0, stdout=b"OK", stderr=b"")
+    # Check that truncation was recorded in debug
+    step_result = state['steps']['truncation_test']
+    assert 'debug' in step_result
+    assert 'injection' in step_result['debug']
 
-            # Create workflow file and state manager
-            workflow_file = create_workflow_file(temp_workspace, workflow)
-            state_manager = StateManager(temp_workspace)
-            state_manager.initialize(workflow_file, {})
+    injection_debug = step_result['debug']['injection']
+    assert injection_debug['injection_truncated'] == True
+    assert 'truncation_details' in injection_debug
 
-            # Execute workflow
-            executor = WorkflowExecutor(
-                workflow=load_workflow_bundle_for_test(temp_workspace, workflow_file),
-                workspace=temp_workspace,
-                state_manager=state_manager,
-                provider_observation_enabled=False,
-            )
-
-            # Override provider registry
-            executor.provider_registry = mock_provider_registry
-
-            state = executor.execute()
-
-            # Check that truncation was recorded in debug
-            step_result = state['steps']['truncation_test']
-            assert 'debug' in step_result
-            assert 'injection' in step_result['debug']
-
-            injection_debug = step_result['debug']['injection']
-            assert injection_debug['injection_truncated'] == True
-            assert 'truncation_details' in injection_debug
-
-            details = injection_debug['truncation_details']
-            assert details['total_size'] > 256 * 1024
-            assert details['shown_size'] <= 256 * 1024
-            assert details['files_shown'] >= 0
-            assert details['files_truncated'] >= 0
+    details = injection_debug['truncation_details']
+    assert details['total_size'] > 256 * 1024
+    assert details['shown_size'] <= 256 * 1024
+    assert details['files_shown'] >= 0
+    assert details['files_truncated'] >= 0
 
 
 def test_dependency_validation_with_injection(temp_workspace, mock_provider_registry):
@@ -713,29 +512,11 @@ def test_dependency_validation_with_injection(temp_workspace, mock_provider_regi
         ]
     }
 
-    with patch.object(mock_provider_registry, 'get') as mock_get:
-        mock_get.return_value = mock_provider_registry._providers['claude']
-
-        # Create workflow file and state manager
-        workflow_file = create_workflow_file(temp_workspace, workflow)
-        state_manager = StateManager(temp_workspace)
-        state_manager.initialize(workflow_file, {})
-
-        executor = WorkflowExecutor(
-            workflow=load_workflow_bundle_for_test(temp_workspace, workflow_file),
-            workspace=temp_workspace,
-            state_manager=state_manager,
-            provider_observation_enabled=False,
-        )
-
-        # Override provider registry
-        executor.provider_registry = mock_provider_registry
-
-        state = executor.execute()
+    state = run_workflow(temp_workspace, mock_provider_registry, workflow)
 
-        # Should fail with exit code 2
-        step_result = state['steps']['missing_deps']
-        assert step_result['status'] == 'failed'
-        assert step_result['exit_code'] == 2
-        assert 'error' in step_result
-        assert step_result['error']['type'] == 'dependency_validation'
+    # Should fail with exit code 2
+    step_result = state['steps']['missing_deps']
+    assert step_result['status'] == 'failed'
+    assert step_result['exit_code'] == 2
+    assert 'error' in step_result
+    assert step_result['error']['type'] == 'dependency_validation'
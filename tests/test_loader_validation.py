@@ -9,7 +9,6 @@ from pathlib import Path
 import re
 
 import pytest
-import tempfile
 
 from orchestrator.exceptions import WorkflowValidationError
 from orchestrator.workflow.validation import WorkflowBoundaryValidationPolicy
@@ -453,10 +452,11 @@ def test_analyze_reusable_write_roots_accepts_hyphenated_relpath_input_refs(tmp_
 class TestLoaderValidation:
     """Test strict DSL validation in the loader."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.workspace = Path(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _isolated_test_workspace(self, tmp_path):
+        """Give each test a pytest-managed workspace and loader."""
+        self.temp_dir = str(tmp_path)
+        self.workspace = tmp_path
         self.loader = WorkflowLoader(self.workspace)
 
     def write_workflow(self, content: dict) -> Path:
@@ -5,9 +5,6 @@ Covers AT-1, AT-2, AT-45, AT-52: Output capture modes and truncation.
 
 import json
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
 
 from orchestrator.exec import OutputCapture, CaptureMode, CaptureResult, StepExecutor
 
@@ -16,11 +13,9 @@ class TestOutputCapture:
     """Test output capture modes and limits."""
 
     @pytest.fixture
-    def temp_workspace(self):
+    def temp_workspace(self, tmp_path):
         """Create a temporary workspace directory."""
-        workspace = Path(tempfile.mkdtemp())
-        yield workspace
-        shutil.rmtree(workspace, ignore_errors=True)
+        return tmp_path
 
     @pytest.fixture
     def capture(self, temp_workspace):
@@ -83,6 +78,31 @@ class TestOutputCapture:
         assert logs_file.exists()
         assert logs_file.read_bytes() == stdout
 
+    def test_at1_lines_capture_truncation_boundary(self, capture):
+        """AT-1: Exactly 10,000 terminated lines fit; CRLF is normalized up to the cut."""
+        exact = "".join(f"line{i}\r\n" for i in range(10000)).encode('utf-8')
+        result = capture.capture(
+            stdout=exact,
+            stderr=b"",
+            step_name="exact_step",
+            mode=CaptureMode.LINES,
+        )
+
+        assert result.truncated is False
+        assert len(result.lines) == 10000
+        assert result.lines[-1] == "line9999"
+
+        result = capture.capture(
+            stdout=exact + b"\xff\r\n",
+            stderr=b"",
+            step_name="over_step",
+            mode=CaptureMode.LINES,
+        )
+
+        assert result.truncated is True
+        assert len(result.lines) == 10000
+        assert result.lines[-1] == "line9999"
+
     def test_at2_json_capture_success(self, capture):
         """AT-2: JSON capture - output_capture: json → steps.X.json object available."""
         data = {"key": "value", "number": 42, "array": [1, 2, 3]}
@@ -355,11 +375,9 @@ class TestStepExecutor:
     """Test step executor with real command execution."""
 
     @pytest.fixture
-    def temp_workspace(self):
+    def temp_workspace(self, tmp_path):
         """Create a temporary workspace directory."""
-        workspace = Path(tempfile.mkdtemp())
-        yield workspace
-        shutil.rmtree(workspace, ignore_errors=True)
+        return tmp_path
 
     @pytest.fixture
     def executor(self, temp_workspace):
@@ -1318,14 +1318,14 @@ def test_typed_snapshot_failure_publishes_closed_row_context_before_preparation(
     if category == "invalid_utf8_dependency":
         dependency.write_bytes(b"\xff")
     else:
-        original_read_text = Path.read_text
+        original_read_bytes = Path.read_bytes
 
-        def _read_text(path: Path, *args, **kwargs):
+        def _read_bytes(path: Path, *args, **kwargs):
             if path == dependency:
                 raise PermissionError("READ_FAILURE_SENTINEL")
-            return original_read_text(path, *args, **kwargs)
+            return original_read_bytes(path, *args, **kwargs)
 
-        monkeypatch.setattr(Path, "read_text", _read_text)
+        monkeypatch.setattr(Path, "read_bytes", _read_bytes)
     executor.provider_executor.prepare_invocation = lambda *_args, **_kwargs: (
         pytest.fail("provider preparation must not be reached")
     )
@@ -13,11 +13,13 @@ from orchestrator.deps.content_snapshot import (
     TRUNCATION_SUMMARY_RESERVE_BYTES,
     AuthoredDependencyRow,
     CanonicalDependencyGroup,
+    ContentDependencySnapshotError,
     DependencyContent,
     DependencyContentSnapshot,
     DependencyGroupTruncation,
     build_content_snapshot,
     render_content_snapshot,
+    snapshot_content_dependencies,
 )
 
 
@@ -47,6 +49,36 @@ def _snapshot(*items: tuple[AuthoredDependencyRow, bytes]):
     return build_content_snapshot(rows, payloads)
 
 
+def test_snapshot_reads_many_dependencies_in_authored_order(tmp_path: Path) -> None:
+    rows = []
+    for index in range(6):
+        (tmp_path / f"dep{index}.md").write_bytes(f"body {index}\r\n".encode("utf-8"))
+        rows.append(_row("required", index, f"dep{index}", f"dep{index}.md", f"dep{index}.md"))
+
+    snapshot = snapshot_content_dependencies(tmp_path, rows)
+
+    assert [group.canonical_target for group in snapshot.canonical_groups] == [
+        f"dep{index}.md" for index in range(6)
+    ]
+    assert [group.normalized_bytes for group in snapshot.canonical_groups] == [
+        f"body {index}\n".encode("utf-8") for index in range(6)
+    ]
+
+
+def test_snapshot_batch_reports_first_failing_row_in_authored_order(tmp_path: Path) -> None:
+    rows = []
+    for index in range(6):
+        if index != 4:
+            (tmp_path / f"dep{index}.md").write_bytes(b"\xff" if index == 2 else b"ok")
+        rows.append(_row("required", index, f"dep{index}", f"dep{index}.md", f"dep{index}.md"))
+
+    with pytest.raises(ContentDependencySnapshotError) as exc_info:
+        snapshot_content_dependencies(tmp_path, rows)
+
+    assert exc_info.value.category == "invalid_utf8_dependency"
+    assert exc_info.value.row == rows[2]
+
+
 def test_snapshot_groups_aliases_without_losing_authored_evidence() -> None:
     rows = (
         _row("optional", 0, "optional_ref", "alias.txt", "real/a.txt"),